@@ -29,7 +29,7 @@ from services.controller_services import (
     county_options,
 )
 from data.data import load_data, load_mao_tiers
-from data.enrich import build_top_buyers_dict
+from data.enrich import build_top_buyers_dict, county_title
 from data.filters import Selection, build_view_df, compute_overall_stats
 from data.geo import build_county_adjacency, load_tn_geojson
 from views.map_view import render_map_and_details
@@ -99,11 +99,11 @@ def run_app() -> None:
     if team_view == "Dispo" and rep_active:
         if "Dispo_Rep_clean" in df_time_sold_for_view.columns:
             df_time_sold_for_view = df_time_sold_for_view[
-                df_time_sold_for_view["Dispo_Rep_clean"] == dispo_rep_choice
+                df_time_sold_for_view["Dispo_Rep_clean"].values == dispo_rep_choice
             ]
         if "Dispo_Rep_clean" in df_time_cut_for_view.columns:
             df_time_cut_for_view = df_time_cut_for_view[
-                df_time_cut_for_view["Dispo_Rep_clean"] == dispo_rep_choice
+                df_time_cut_for_view["Dispo_Rep_clean"].values == dispo_rep_choice
             ]
 
 
@@ -111,11 +111,11 @@ def run_app() -> None:
     if team_view == "Dispo" and acq_rep_active:
         if "Acquisition_Rep_clean" in df_time_sold_for_view.columns:
             df_time_sold_for_view = df_time_sold_for_view[
-                df_time_sold_for_view["Acquisition_Rep_clean"] == acq_rep_choice
+                df_time_sold_for_view["Acquisition_Rep_clean"].values == acq_rep_choice
             ]
         if "Acquisition_Rep_clean" in df_time_cut_for_view.columns:
             df_time_cut_for_view = df_time_cut_for_view[
-                df_time_cut_for_view["Acquisition_Rep_clean"] == acq_rep_choice
+                df_time_cut_for_view["Acquisition_Rep_clean"].values == acq_rep_choice
             ]
 
 
@@ -230,7 +230,7 @@ def run_app() -> None:
     else:
         acq_rows = []
         for county_up, buyer_ct in (buyer_count_by_county or {}).items():
-            acq_rows.append({"County": str(county_up).title(), "Buyer count": int(buyer_ct or 0)})
+            acq_rows.append({"County": county_title(county_up), "Buyer count": int(buyer_ct or 0)})
 
         acq_rank_df = pd.DataFrame(acq_rows)
 
@@ -257,8 +257,8 @@ def run_app() -> None:
     buyer_sold_counts: dict[str, int] = {}
     if buyer_active and mode in ["Sold", "Both"] and "Buyer_clean" in df_time_sold_for_view.columns:
         buyer_sold_counts = (
-            df_time_sold_for_view[df_time_sold_for_view["Buyer_clean"] == buyer_choice]
-            .groupby("County_clean_up")
+            df_time_sold_for_view[df_time_sold_for_view["Buyer_clean"].values == buyer_choice]
+            .groupby("County_clean_up", observed=True)
             .size()
             .to_dict()
         )
@@ -3,9 +3,9 @@ from __future__ import annotations
 import pandas as pd
 import streamlit as st
 
-from core.config import C
+from core.config import ADDR, BUYER, CITY, DATE, SF_URL, STATUS
 from data.filters import compute_overall_stats
-from data.enrich import build_top_buyers_dict
+from data.enrich import build_top_buyers_dict, county_title
 from ui.ui_sidebar import render_county_quick_search
 from debug.debug_tools import debug_event
 
@@ -27,14 +27,14 @@ def compute_buyer_context_from_df(df_time_sold: pd.DataFrame) -> tuple[pd.DataFr
 
     buyer_count_by_county = (
         df_sold_buyers[df_sold_buyers["Buyer_clean"] != ""]
-        .groupby("County_clean_up")["Buyer_clean"]
+        .groupby("County_clean_up", observed=True)["Buyer_clean"]
         .nunique()
         .to_dict()
     )
 
     buyers_set_by_county = (
         df_sold_buyers[df_sold_buyers["Buyer_clean"] != ""]
-        .groupby("County_clean_up")["Buyer_clean"]
+        .groupby("County_clean_up", observed=True)["Buyer_clean"]
         .apply(lambda s: set(s.dropna().tolist()))
         .to_dict()
     )
@@ -79,7 +79,7 @@ def render_acquisitions_sidebar(
     for n in neighbors:
         bset = buyers_set_by_county.get(n, set())
         neighbor_buyers_union |= bset
-        neighbor_rows.append({"County": n.title(), "# Buyers": len(bset)})
+        neighbor_rows.append({"County": county_title(n), "# Buyers": len(bset)})
 
     neighbor_unique_buyers = len(neighbor_buyers_union)
 
@@ -146,7 +146,7 @@ def render_dispo_county_quick_lookup(
         st.session_state["county_source"] = "dropdown"
         st.rerun()
 
-    chosen_title = chosen_key.title()
+    chosen_title = county_title(chosen_key)
 
     sold_scope = df_time_sold_for_stats[df_time_sold_for_stats["County_clean_up"] == chosen_key]
     cut_scope = df_time_cut_for_stats[df_time_cut_for_stats["County_clean_up"] == chosen_key]
@@ -233,7 +233,7 @@ def handle_map_click(map_state: dict, team_view: str) -> None:
 
         if team_view == "Acquisitions":
             st.session_state["acq_selected_county"] = clicked_key
-            st.session_state["acq_pending_county_title"] = clicked_key.title()
+            st.session_state["acq_pending_county_title"] = county_title(clicked_key)
             st.rerun()
 
 
@@ -271,7 +271,7 @@ def render_below_map_panel(
     buyer_ct = int(buyer_count_by_county.get(ckey, 0))
 
     st.markdown("---")
-    st.subheader(f"{ckey.title()} County details")
+    st.subheader(f"{county_title(ckey)} County details")
 
     a, b, c, d, e = st.columns([1, 1, 1.2, 1.2, 1.6], gap="small")
     a.metric("Sold", sold)
@@ -285,13 +285,13 @@ def render_below_map_panel(
         st.info("No properties match the current filters for this county.")
         return
 
-    show_cols = [C.address, C.city, C.status, C.buyer, C.date, C.sf_url]
+    show_cols = [ADDR, CITY, STATUS, BUYER, DATE, SF_URL]
     show_cols = [col for col in show_cols if col in df_props.columns]
     df_props = df_props[show_cols].copy()
 
-    if C.sf_url in df_props.columns:
-        df_props["Salesforce"] = df_props[C.sf_url]
-        df_props = df_props.drop(columns=[C.sf_url])
+    if SF_URL in df_props.columns:
+        df_props["Salesforce"] = df_props[SF_URL]
+        df_props = df_props.drop(columns=[SF_URL])
 
     st.markdown("#### Properties in current view")
     st.dataframe(
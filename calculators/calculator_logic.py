@@ -24,6 +24,7 @@ from calculators.calculator_support import (
     find_tail_threshold,
     tail_cut_rate_at_price,
 )
+from data.enrich import county_title
 
 
 def compute_feasibility(
@@ -193,7 +194,7 @@ def compute_feasibility(
 
     return {
         "county_key": county_key,
-        "county_title": county_key.title(),
+        "county_title": county_title(county_key),
         "input_price": input_price,
         "rec": rec,
         "rec_reason_tag": rec_reason_tag,
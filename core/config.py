@@ -75,3 +75,7 @@ class Cols:
 
 C = Cols()
 
+# Plain module-level aliases for hot paths (LOAD_GLOBAL instead of attribute lookup)
+ADDR, CITY, COUNTY, SF_URL, STATUS, BUYER, DATE = (
+    C.address, C.city, C.county, C.sf_url, C.status, C.buyer, C.date
+)
@@ -1,35 +1,309 @@
-import io
+import contextlib
+import csv
+import hashlib
+import json
+import os
 import re
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import requests
 import streamlit as st
-
-from core.config import SHEET_URL, MAO_TIERS_URL, REQUIRED_COLS, C
-
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from urllib3.util.retry import Retry
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pq
+except ImportError:  # pyarrow ships with streamlit; keep a pandas-only fallback anyway
+    pa = pa_csv = pq = None
+
+from core.config import SHEET_URL, MAO_TIERS_URL, REQUIRED_COLS, BUYER, COUNTY, DATE, STATUS
+
+
+# Low-cardinality columns that are grouped/compared on every rerun.
+# Stored as categoricals so groupby + equality work on small int codes.
+CATEGORICAL_COLS = (
+    "County_clean_up", "County_key", "Status_norm", "Buyer_clean", "Dispo_Rep_clean", "Market_clean",
+    "Acquisition_Rep_clean",
+)
+TIER_CATEGORICAL_COLS = ("County_clean_up", "County_key", "MAO_Tier")
+
+# Raw deals-sheet columns the app reads (everything else in the sheet is skipped at parse time)
+OPTIONAL_COLS = (
+    "Salesforce_URL", "Buyer", "Date", "Status", "County", "Address", "City",
+    "Dispo Rep", "Contract Price", "Amended Price", "Wholesale Price", "Market", "Acquisition Rep",
+)
+DISPO_REP_COLS = ("Dispo Rep", "Dispo_Rep", "DispoRep", "DISPO REP")
+_DISPO_REP_ALIASES = ("dispo rep", "dispo_rep", "disporep")  # DISPO_REP_COLS, stripped + lowercased
+DEAL_SHEET_COLS = frozenset(REQUIRED_COLS) | frozenset(OPTIONAL_COLS) | frozenset(DISPO_REP_COLS)
+
+
+def _is_deal_sheet_col(header: str) -> bool:
+    """Parse-time column filter: DEAL_SHEET_COLS, plus any spelling normalize_inputs accepts for the dispo rep."""
+    return header in DEAL_SHEET_COLS or header.strip().lower() in _DISPO_REP_ALIASES
+
+
+# Arrow-backed strings with NaN semantics: .str ops run on Arrow kernels instead of
+# per-cell Python objects. (pandas >= 2.3; it is the default "str" dtype in pandas 3.)
+try:
+    RAW_STR_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+except (TypeError, ImportError):
+    RAW_STR_DTYPE = str
+
+# Regexes used by the column normalizers (compiled once, not per call)
+_COUNTY_WORD_RE = re.compile(r"\bCOUNTY\b")
+_NON_ALPHA_RE = re.compile(r"[^A-Z]")
+_STATUS_SEP_RE = re.compile(r"[\s\-_]+")
+_NON_LOWER_RE = re.compile(r"[^a-z]")
+_MONEY_CHARS_RE = re.compile(r"[\$,]")
+
+# Date layouts the sheets have used (US-style first); see _parse_dates
+_DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d", "%m/%d/%y", "%m/%d/%Y %H:%M:%S", "%Y-%m-%d %H:%M:%S")
+
+# df.attrs key of the per-load token load_data stamps on its frame
+LOAD_TOKEN_ATTR = "load_token"
+
+# Normalized deals frame persisted between cold starts (see load_data)
+PARQUET_CACHE_PATH = os.path.join(tempfile.gettempdir(), "tn_sheet.parquet")
+# Parquet schema-metadata key holding the sheet revision the body was built from
+_PARQUET_REVISION_KEY = b"tnmap.revision"
+# Bump whenever normalize_inputs' output changes (columns, dtypes, categories) so
+# a Parquet file written by older code is never served after a deploy
+PARQUET_CACHE_VERSION = 2
+# Raw sheet downloads + their ETag / Last-Modified (see _read_csv)
+CSV_CACHE_DIR = os.path.join(tempfile.gettempdir(), "tnmap_csv")
+
+# One pooled keep-alive session for every sheet request (deals, tiers, HEAD checks)
+# so repeat loads against the same host skip the TCP/TLS handshake.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.3)),
+)
 
 # -------------------------
 # Low-level helpers
 # -------------------------
 
-def _read_csv(url: str) -> pd.DataFrame:
-    headers = {"User-Agent": "Mozilla/5.0"}
-    r = requests.get(url, headers=headers, timeout=30)
-    r.raise_for_status()
-    return pd.read_csv(io.StringIO(r.text))
+def _parse_csv(stream, *, usecols=None, dtype=None) -> pd.DataFrame:
+    """
+    Parse a binary CSV stream (positioned at the header line).
+    - usecols: optional set of wanted columns (missing ones are ignored), or
+      a callable that is given each header name, like pd.read_csv's
+    - dtype: applied to every column; cells are read as raw strings, so no
+      per-column type inference runs
+    Uses the multi-threaded pyarrow CSV reader when available.
+    """
+    # Consume the header line ourselves to decide which columns to parse
+    first_line = stream.readline().decode("utf-8-sig").rstrip("\r\n")
+    header = next(csv.reader([first_line]), [])
+    if usecols is not None:
+        # Only ask for wanted columns that actually exist in the sheet
+        wanted = usecols if callable(usecols) else usecols.__contains__
+        usecols = list(dict.fromkeys(c for c in header if wanted(c)))
+
+    if pa_csv is None:
+        return pd.read_csv(stream, header=None, names=header, usecols=usecols, dtype=dtype)
+
+    convert = pa_csv.ConvertOptions(
+        include_columns=usecols,
+        strings_can_be_null=True,  # blank cells -> NaN, like pd.read_csv
+        column_types=dict.fromkeys(usecols or header, pa.string()) if dtype is not None else None,
+    )
+    table = pa_csv.read_csv(
+        stream,
+        read_options=pa_csv.ReadOptions(column_names=header),
+        convert_options=convert,
+    )
+    df = table.to_pandas()
+    return df.astype(dtype) if dtype is not None else df
+
+
+@contextlib.contextmanager
+def _atomic_file(path: str):
+    """
+    Binary file handle that replaces path only once the block finishes.
+    Each write gets its own mkstemp file next to path, so concurrent writers
+    never share a temp file and readers only ever see a complete file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _csv_cache_path(url: str) -> str:
+    """
+    Path of the on-disk copy of a sheet download. The file is one JSON line with
+    the response's ETag / Last-Modified followed by the raw CSV body, so a body
+    and the validators it was served with are always replaced together.
+    """
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(CSV_CACHE_DIR, f"{key}.csv")
+
+
+def _open_csv_cache(path: str):
+    """(validators, binary handle positioned at the CSV header) of a cached download, or (None, None)."""
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return None, None
+    try:
+        meta = json.loads(f.readline())
+        if not isinstance(meta, dict):
+            raise ValueError("not a sheet cache file")
+    except ValueError:
+        f.close()
+        return None, None
+    return meta, f
+
+
+def _read_csv(url: str, *, usecols=None, dtype=None, revalidate: bool = True) -> pd.DataFrame:
+    """
+    Download a sheet CSV and parse it (see _parse_csv for usecols / dtype).
+
+    The body is streamed to an on-disk copy together with its ETag /
+    Last-Modified; later downloads revalidate with If-None-Match /
+    If-Modified-Since and parse the disk copy on a 304, skipping the transfer.
+    A 304 is only honored while the copy still carries the validators that were
+    sent (another worker may have replaced it meanwhile); otherwise the sheet is
+    fetched again unconditionally (revalidate=False).
+    If the cache dir isn't writable the response streams straight into the parser.
+    """
+    cache_path = _csv_cache_path(url)
+    validators = {}
+    if revalidate:
+        meta, f = _open_csv_cache(cache_path)
+        if f is not None:
+            f.close()
+            if meta.get("etag"):
+                validators["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                validators["If-Modified-Since"] = meta["last_modified"]
+
+    with _SESSION.get(url, headers=validators, timeout=30, stream=True) as r:
+        if r.status_code == 304 and validators:
+            current, f = _open_csv_cache(cache_path)
+            if f is not None and current == meta:
+                with f:
+                    return _parse_csv(f, usecols=usecols, dtype=dtype)
+            if f is not None:
+                f.close()
+            return _read_csv(url, usecols=usecols, dtype=dtype, revalidate=False)
+
+        r.raise_for_status()
+        r.raw.decode_content = True  # transparently gunzip
+
+        meta = {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+        cache_writer = contextlib.ExitStack()
+        try:
+            os.makedirs(CSV_CACHE_DIR, exist_ok=True)
+            out = cache_writer.enter_context(_atomic_file(cache_path))
+        except OSError:
+            return _parse_csv(r.raw, usecols=usecols, dtype=dtype)
+        with cache_writer:
+            out.write(json.dumps(meta).encode("utf-8") + b"\n")
+            shutil.copyfileobj(r.raw, out)
+
+    _, f = _open_csv_cache(cache_path)
+    if f is None:
+        raise OSError(f"Sheet cache {cache_path} was unreadable right after it was written")
+    with f:
+        return _parse_csv(f, usecols=usecols, dtype=dtype)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _sheet_revision(url: str):
+    """ETag / Last-Modified of the sheet export (None if unavailable); a cheap HEAD, cached briefly."""
+    try:
+        r = _SESSION.head(url, timeout=10, allow_redirects=True)
+        r.raise_for_status()
+    except requests.RequestException:
+        return None
+    return r.headers.get("ETag") or r.headers.get("Last-Modified")
+
+
+def _parquet_cache_stamp(revision: str) -> bytes:
+    """Cache key stored with the Parquet body: code schema version + sheet revision."""
+    return f"v{PARQUET_CACHE_VERSION}:{revision}".encode("utf-8")
+
+
+def _read_parquet_cache(revision):
+    """Cached normalized frame if it was written for this sheet revision, else None."""
+    if not revision or pq is None:
+        return None
+    try:
+        # One open handle for the revision check and the read: a concurrent
+        # os.replace can't swap in a different body between the two
+        with open(PARQUET_CACHE_PATH, "rb") as f:
+            metadata = pq.read_schema(f).metadata or {}
+            if metadata.get(_PARQUET_REVISION_KEY) != _parquet_cache_stamp(revision):
+                return None
+            f.seek(0)
+            return pd.read_parquet(f, engine="pyarrow")
+    except Exception:
+        return None
+
+
+def _write_parquet_cache(df: pd.DataFrame, revision) -> None:
+    """Best effort: a read-only or full /tmp just means the next cold start re-parses."""
+    if not revision or pa is None:
+        return
+    try:
+        # The revision lives in the file's own metadata, so body and key can't drift apart
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), _PARQUET_REVISION_KEY: _parquet_cache_stamp(revision)}
+        with _atomic_file(PARQUET_CACHE_PATH) as f:
+            pq.write_table(table.replace_schema_metadata(metadata), f, compression="zstd")
+    except Exception:
+        pass
 
 
-def _normalize_county_key(x: str) -> str:
+def _normalize_county_key(s: pd.Series) -> pd.Series:
     """
-    Forgiving county join key:
+    Forgiving county join key (vectorized over a Series):
     - uppercase
     - remove the word 'COUNTY'
     - remove anything that's not A-Z
     """
-    s = "" if x is None else str(x)
-    s = s.upper().strip()
-    s = re.sub(r"\bCOUNTY\b", "", s)
-    s = re.sub(r"[^A-Z]", "", s)
-    return s
+    s = s.fillna("").astype(RAW_STR_DTYPE).str.upper().str.strip()
+    s = s.str.replace(_COUNTY_WORD_RE, "", regex=True)
+    return s.str.replace(_NON_ALPHA_RE, "", regex=True)
+
+
+# Known historical county typos (keep them centralized here)
+_COUNTY_TYPOS = {"STEWART COUTY": "STEWART"}
+
+# Compacted status spelling -> canonical status (anything else -> "")
+_STATUS_MAP = {
+    "sold": "sold", "closed": "sold", "close": "sold", "closing": "sold", "settled": "sold",
+    "cutloose": "cut loose", "cutlose": "cut loose", "cut": "cut loose",
+}
+
+
+def _county_columns(series: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """
+    (County_clean_up, County_key) for a raw county column, shared by both sheets.
+    Each distinct spelling is cleaned once, then broadcast back to the rows.
+    """
+    codes, uniques = pd.factorize(series.fillna(""))
+    names = _clean_str(pd.Series(uniques, dtype=str)).str.upper()
+    # Strip trailing " COUNTY" because GeoJSON + app logic use "DAVIDSON", not "DAVIDSON COUNTY"
+    names = names.str.removesuffix(" COUNTY").str.strip().replace(_COUNTY_TYPOS)
+    keys = _normalize_county_key(names)
+    return names.take(codes).set_axis(series.index), keys.take(codes).set_axis(series.index)
 
 
 def _normalize_status(series: pd.Series) -> pd.Series:
@@ -39,16 +313,78 @@ def _normalize_status(series: pd.Series) -> pd.Series:
       - 'cut loose'
     Everything else becomes ''.
     """
-    s = series.fillna("").astype(str).str.strip().str.lower()
+    # A status column holds a handful of spellings: compact + map each distinct
+    # one once, then broadcast back to the rows by factorize code
+    codes, uniques = pd.factorize(series.fillna(""))
+    s = pd.Series(uniques, dtype=RAW_STR_DTYPE).str.strip().str.lower()
     compact = (
-        s.str.replace(r"[\s\-_]+", "", regex=True)
-         .str.replace(r"[^a-z]", "", regex=True)
+        s.str.replace(_STATUS_SEP_RE, "", regex=True)
+         .str.replace(_NON_LOWER_RE, "", regex=True)
     )
+    canonical = compact.map(_STATUS_MAP).fillna("")
+    return canonical.take(codes).set_axis(series.index)
+
+def _detect_date_format(series: pd.Series):
+    """First of _DATE_FORMATS that parses a small sample of the column, else None."""
+    sample = series.dropna().head(20)
+    sample = sample[sample.astype(str).str.strip() != ""]
+    if sample.empty:
+        return None
+    for fmt in _DATE_FORMATS:
+        try:
+            pd.to_datetime(sample, format=fmt)
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
+def _parse_mixed_dates(series: pd.Series) -> pd.Series:
+    """
+    Per-value "mixed" parse, returned tz-naive. Offset-bearing cells
+    ("2024-03-01T00:00:00Z", "+05:00") are converted to UTC wall time, so a
+    few of them among naive dates can't raise "Mixed timezones detected".
+    """
+    return pd.to_datetime(series, format="mixed", errors="coerce", utc=True).dt.tz_convert(None)
+
+
+def _parse_dates(series: pd.Series) -> pd.Series:
+    """
+    Parse the sheet's date column with an explicit format (no per-value inference).
+    Cells that don't match the detected format fall back to "mixed" parsing;
+    anything unparseable becomes NaT. The result is always tz-naive.
+    """
+    fmt = _detect_date_format(series)
+    if fmt is None:
+        return _parse_mixed_dates(series)
+
+    dt = pd.to_datetime(series, format=fmt, errors="coerce")
+    missed = dt.isna() & (series.fillna("").astype(str).str.strip() != "")
+    if missed.any():
+        dt[missed] = _parse_mixed_dates(series[missed])
+    return dt
+
+
+def _year_of(dates: pd.Series) -> pd.Series:
+    """
+    Calendar year straight from the datetime64 values (no .dt accessor).
+    NaT stays missing (float NaN), so Year.isna() still marks undated rows.
+    Tz-aware input uses its local wall-clock year, like .dt.year.
+    """
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+    vals = dates.to_numpy()
+    years = vals.astype("datetime64[Y]").astype(np.int64) + 1970
+    missing = np.isnat(vals)
+    if missing.any():
+        return pd.Series(np.where(missing, np.nan, years), index=dates.index)
+    return pd.Series(years.astype(np.int32), index=dates.index)
+
+
+def _clean_str(series: pd.Series) -> pd.Series:
+    """Stripped text with missing cells as "" (fill first, so NaN never becomes "nan")."""
+    return series.fillna("").astype(RAW_STR_DTYPE).str.strip()
 
-    out = pd.Series([""] * len(s), index=s.index, dtype="object")
-    out.loc[compact.isin(["sold", "closed", "close", "closing", "settled"])] = "sold"
-    out.loc[compact.isin(["cutloose", "cutlose", "cut"])] = "cut loose"
-    return out
 
 def _to_number(series: pd.Series) -> pd.Series:
     """
@@ -57,8 +393,11 @@ def _to_number(series: pd.Series) -> pd.Series:
     """
     if series is None:
         return pd.Series(dtype="float64")
-    s = series.astype(str).str.replace(r"[\$,]", "", regex=True).str.strip()
-    s = s.replace({"": None, "nan": None, "None": None})
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        # Already numeric (e.g. a column the CSV engine typed itself): no string round-trip
+        return pd.to_numeric(series, errors="coerce").astype("float64")
+    # Blank / "nan" / "None" leftovers are coerced to NaN by to_numeric itself
+    s = series.astype(RAW_STR_DTYPE).str.replace(_MONEY_CHARS_RE, "", regex=True).str.strip()
     return pd.to_numeric(s, errors="coerce")
 
 
@@ -75,67 +414,43 @@ def normalize_inputs(df: pd.DataFrame) -> pd.DataFrame:
       - County_clean_up, County_key
       - Buyer_clean
       - Status_norm
-      - Date_dt, Year
+      - Date_dt, Year (and Date itself holds the parsed datetime)
     Also ensures optional columns exist (no KeyErrors).
+
+    Adds columns to df in place (no up-front copy); the caller hands over a
+    freshly parsed frame it doesn't reuse.
     """
-    df = df.copy()
+    # Resolve alternate header spellings before placeholder columns are added
+    dispo_col = _pick_column(_column_index(df.columns), _DISPO_REP_ALIASES)
 
     # Ensure expected columns exist (even if the sheet changes)
     # (Do not remove columns; only add missing ones.)
-    optional_cols = [
-    "Salesforce_URL", "Buyer", "Date", "Status", "County", "Address", "City",
-    "Dispo Rep", "Contract Price", "Amended Price", "Wholesale Price", "Market", "Acquisition Rep",
-]
-
-    for col in optional_cols:
+    for col in OPTIONAL_COLS:
         if col not in df.columns:
             df[col] = ""
 
     # --- County normalization ---
-    county_raw = df[C.county].astype(str).fillna("").str.strip().str.upper()
-
-    # Strip trailing " COUNTY" because GeoJSON + app logic use "DAVIDSON", not "DAVIDSON COUNTY"
-    county_clean = county_raw.str.replace(r"\s+COUNTY\b", "", regex=True).str.strip()
-
-    # Known historical typo fix (keep it centralized here)
-    county_clean = county_clean.replace({"STEWART COUTY": "STEWART"})
-
-    df["County_clean_up"] = county_clean
-    df["County_key"] = df["County_clean_up"].apply(_normalize_county_key)
+    df["County_clean_up"], df["County_key"] = _county_columns(df[COUNTY])
 
     # --- Buyer normalization ---
-    df["Buyer_clean"] = df[C.buyer].astype(str).fillna("").astype(str).str.strip()
+    df["Buyer_clean"] = _clean_str(df[BUYER])
 
     # --- Status normalization ---
-    df["Status_norm"] = _normalize_status(df[C.status])
+    df["Status_norm"] = _normalize_status(df[STATUS])
 
     # --- Date parsing (momentum.py expects Date_dt) ---
-    df["Date_dt"] = pd.to_datetime(df.get(C.date), errors="coerce")
-    df["Year"] = df["Date_dt"].dt.year
-
-        # --- Dispo Rep (new column) ---
-    # Accept a few possible header spellings
-    dispo_col = None
-    for cand in ["Dispo Rep", "Dispo_Rep", "DispoRep", "DISPO REP"]:
-        if cand in df.columns:
-            dispo_col = cand
-            break
-
-    if dispo_col is None:
-        df["Dispo_Rep"] = ""
-    else:
-        df["Dispo_Rep"] = df[dispo_col]
-
-    df["Dispo_Rep_clean"] = df["Dispo_Rep"].astype(str).fillna("").str.strip()
+    df["Date_dt"] = _parse_dates(df[DATE])
+    # The sheet's Date column carries the parsed value too, so ui.controls.ensure_year_column
+    # finds the frame already in shape and returns it as-is on every rerun
+    df[DATE] = df["Date_dt"]
+    df["Year"] = _year_of(df["Date_dt"])
 
-        # --- Market + Acquisition Rep (clean) ---
-    if "Market" not in df.columns:
-        df["Market"] = ""
-    df["Market_clean"] = df["Market"].astype(str).fillna("").str.strip()
+    # --- Dispo Rep (any accepted header spelling) ---
+    df["Dispo_Rep_clean"] = _clean_str(df[dispo_col]) if dispo_col else ""
 
-    if "Acquisition Rep" not in df.columns:
-        df["Acquisition Rep"] = ""
-    df["Acquisition_Rep_clean"] = df["Acquisition Rep"].astype(str).fillna("").str.strip()
+    # --- Market + Acquisition Rep (clean) ---
+    df["Market_clean"] = _clean_str(df["Market"])
+    df["Acquisition_Rep_clean"] = _clean_str(df["Acquisition Rep"])
 
     # --- Financials (numeric) ---
     df["Contract_Price_num"] = _to_number(df["Contract Price"]) if "Contract Price" in df.columns else pd.Series([None] * len(df))
@@ -143,16 +458,44 @@ def normalize_inputs(df: pd.DataFrame) -> pd.DataFrame:
     df["Wholesale_Price_num"] = _to_number(df["Wholesale Price"]) if "Wholesale Price" in df.columns else pd.Series([None] * len(df))
 
     # Effective contract price = amended if present else contract
-    df["Effective_Contract_Price"] = df["Contract_Price_num"]
-    has_amended = df["Amended_Price_num"].notna()
-    df.loc[has_amended, "Effective_Contract_Price"] = df.loc[has_amended, "Amended_Price_num"]
+    df["Effective_Contract_Price"] = df["Amended_Price_num"].combine_first(df["Contract_Price_num"])
 
     # Gross Profit = Wholesale - Effective Contract (only when both exist)
     df["Gross_Profit"] = df["Wholesale_Price_num"] - df["Effective_Contract_Price"]
 
+    # --- Categoricals (cheap groupby / equality downstream) ---
+    for col in CATEGORICAL_COLS:
+        df[col] = df[col].astype("category")
+
+    # Sort once by county (ordered categorical) so every downstream slice stays
+    # county-contiguous and groupby(sort=False) walks sorted keys.
+    df["County_clean_up"] = df["County_clean_up"].cat.as_ordered()
+    df = df.sort_values("County_clean_up", kind="mergesort").reset_index(drop=True)
+
     return df
 
 
+# Accepted header spellings for the MAO tiers sheet (matched stripped + lowercased)
+_TIER_COUNTY_ALIASES = ("county", "county_name", "countyname")
+_TIER_TIER_ALIASES = ("tier", "mao tier", "mao_tier")
+_TIER_RANGE_ALIASES = ("mao range", "mao_range", "range")
+_TIER_MIN_ALIASES = ("mao min", "mao_min", "min")
+_TIER_MAX_ALIASES = ("mao max", "mao_max", "max")
+
+
+def _column_index(columns) -> dict:
+    """Map stripped, lowercased header -> actual column name (first spelling wins)."""
+    index = {}
+    for c in columns:
+        index.setdefault(str(c).strip().lower(), c)
+    return index
+
+
+def _pick_column(col_index: dict, aliases: tuple):
+    """First column whose normalized header matches one of the aliases, else None."""
+    return next((col_index[n] for n in aliases if n in col_index), None)
+
+
 def normalize_tiers(tiers: pd.DataFrame) -> pd.DataFrame:
     """
     One place to normalize the MAO tiers sheet so it matches the rest of the app.
@@ -166,81 +509,50 @@ def normalize_tiers(tiers: pd.DataFrame) -> pd.DataFrame:
     tiers = tiers.copy()
     tiers.columns = [str(c).strip() for c in tiers.columns]
 
-    # County column
-    county_col = None
-    for c in tiers.columns:
-        if str(c).strip().lower() in ("county", "county_name", "countyname"):
-            county_col = c
-            break
-    if county_col is None:
-        county_col = tiers.columns[0]  # fallback
-
-    # Tier column
-    tier_col = None
-    for c in tiers.columns:
-        lc = str(c).strip().lower()
-        if lc in ("tier", "mao tier", "mao_tier"):
-            tier_col = c
-            break
-
-    # Optional single range column
-    range_col = None
-    for c in tiers.columns:
-        lc = str(c).strip().lower()
-        if lc in ("mao range", "mao_range", "range"):
-            range_col = c
-            break
-
-    # Min/Max columns (your sheet uses these)
-    min_col = None
-    max_col = None
-    for c in tiers.columns:
-        lc = str(c).strip().lower()
-        if lc in ("mao min", "mao_min", "min"):
-            min_col = c
-        if lc in ("mao max", "mao_max", "max"):
-            max_col = c
+    col_index = _column_index(tiers.columns)
+    county_col = _pick_column(col_index, _TIER_COUNTY_ALIASES) or tiers.columns[0]  # fallback
+    tier_col = _pick_column(col_index, _TIER_TIER_ALIASES)
+    # Optional single range column, else Min/Max columns (your sheet uses these)
+    range_col = _pick_column(col_index, _TIER_RANGE_ALIASES)
+    min_col = _pick_column(col_index, _TIER_MIN_ALIASES)
+    max_col = _pick_column(col_index, _TIER_MAX_ALIASES)
 
     df = pd.DataFrame()
 
     # Normalize county display name the same way as deals sheet
-    county_raw = tiers[county_col].astype(str).fillna("").str.strip().str.upper()
-    county_clean = county_raw.str.replace(r"\s+COUNTY\b", "", regex=True).str.strip()
-    county_clean = county_clean.replace({"STEWART COUTY": "STEWART"})
-    df["County_clean_up"] = county_clean
-    df["County_key"] = df["County_clean_up"].apply(_normalize_county_key)
+    df["County_clean_up"], df["County_key"] = _county_columns(tiers[county_col])
 
-    df["MAO_Tier"] = tiers[tier_col].astype(str).str.strip() if tier_col else ""
+    df["MAO_Tier"] = _clean_str(tiers[tier_col]) if tier_col else ""
 
     # Build MAO_Range_Str
     if range_col and range_col in tiers.columns:
         df["MAO_Range_Str"] = tiers[range_col].astype(str).str.strip()
     elif min_col and max_col and min_col in tiers.columns and max_col in tiers.columns:
-        def to_pct(x):
-            try:
-                v = float(x)
-                if v <= 1.0:
-                    v *= 100.0
-                return v
-            except Exception:
-                return None
-
-        mins = tiers[min_col].apply(to_pct)
-        maxs = tiers[max_col].apply(to_pct)
-
-        def fmt_range(lo, hi):
-            if lo is None and hi is None:
-                return ""
-            if lo is None:
-                return f"≤{hi:.0f}%"
-            if hi is None:
-                return f"≥{lo:.0f}%"
-            return f"{lo:.0f}%–{hi:.0f}%"
-
-        df["MAO_Range_Str"] = [fmt_range(lo, hi) for lo, hi in zip(mins, maxs)]
+        def to_pct(s: pd.Series) -> pd.Series:
+            # Fractions (<= 1.0) are scaled to percentages; unparseable cells -> NaN
+            v = pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64")
+            return pd.Series(np.where(v <= 1.0, v * 100.0, v), index=s.index)
+
+        mins = to_pct(tiers[min_col])
+        maxs = to_pct(tiers[max_col])
+
+        # Vectorized "lo%–hi%" / "≥lo%" / "≤hi%" formatting (blank when both missing);
+        # each shape is only concatenated for the rows that use it
+        has_lo, has_hi = mins.notna(), maxs.notna()
+        lo_s = mins.round().astype("Int64").astype(str) + "%"
+        hi_s = maxs.round().astype("Int64").astype(str) + "%"
+        both = has_lo & has_hi
+        range_str = pd.Series("", index=tiers.index, dtype=str)
+        range_str[both] = lo_s[both] + "–" + hi_s[both]
+        range_str[has_lo & ~has_hi] = "≥" + lo_s[has_lo & ~has_hi]
+        range_str[has_hi & ~has_lo] = "≤" + hi_s[has_hi & ~has_lo]
+        df["MAO_Range_Str"] = range_str
     else:
         df["MAO_Range_Str"] = ""
 
+    for col in TIER_CATEGORICAL_COLS:
+        df[col] = df[col].astype("category")
+
     return df[out_cols]
 
 
@@ -248,35 +560,85 @@ def normalize_tiers(tiers: pd.DataFrame) -> pd.DataFrame:
 # Cached loaders (A1 + A2)
 # -------------------------
 
+@st.cache_data(ttl=3600, max_entries=2, show_spinner=False)
+def _cached_tiers(revision: str) -> pd.DataFrame:
+    """Normalized tiers sheet for one sheet revision."""
+    return normalize_tiers(_read_csv(MAO_TIERS_URL))
+
+
 @st.cache_data(ttl=300, show_spinner=False)
 def load_mao_tiers() -> pd.DataFrame:
-    raw = _read_csv(MAO_TIERS_URL)
-    return normalize_tiers(raw)
+    # Unchanged sheet (same ETag / Last-Modified): reuse the normalized tiers
+    revision = _sheet_revision(MAO_TIERS_URL)
+    if revision:
+        return _cached_tiers(revision)
+    return normalize_tiers(_read_csv(MAO_TIERS_URL))
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+def _read_deals(revision) -> pd.DataFrame:
+    """Normalized deals sheet: from the Parquet copy for this revision, else downloaded."""
+    df = _read_parquet_cache(revision)
+    if df is None:
+        raw = _read_csv(SHEET_URL, usecols=_is_deal_sheet_col, dtype=RAW_STR_DTYPE)
+
+        missing = [c for c in REQUIRED_COLS if c not in raw.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+        df = normalize_inputs(raw)
+        _write_parquet_cache(df, revision)
+    return df
+
+
+@st.cache_resource(ttl=3600, max_entries=2, show_spinner=False)
+def _cached_deals(revision: str) -> pd.DataFrame:
+    """_read_deals keyed by sheet revision: an unchanged sheet is never re-parsed (read-only)."""
+    return _read_deals(revision)
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
 def load_data() -> pd.DataFrame:
-    raw = _read_csv(SHEET_URL)
+    """
+    Load + normalize the deals sheet (merged with MAO tiers).
 
-    missing = [c for c in REQUIRED_COLS if c not in raw.columns]
-    if missing:
-        raise ValueError(f"Missing required columns: {missing}")
+    Cached as a shared resource: every rerun/session gets the same frame
+    without a pickle round-trip, so callers must treat it as read-only
+    (derive new frames via filtering/assign instead of writing columns).
+    """
+    # Fetch the tiers sheet in parallel with the deals sheet (both are network-bound).
+    # The worker inherits the script context so load_mao_tiers' cache works as usual.
+    script_ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=1, initializer=add_script_run_ctx, initargs=(None, script_ctx)) as pool:
+        tiers_future = pool.submit(load_mao_tiers)
 
-    df = normalize_inputs(raw)
+        # Unchanged sheet (same ETag / Last-Modified): reuse the normalized frame for that
+        # revision. Without a validator we can't tell, so always re-read.
+        revision = _sheet_revision(SHEET_URL)
+        df = _cached_deals(revision) if revision else _read_deals(None)
 
     # Merge tiers (keep app running if tiers sheet hiccups)
     try:
-        tiers = load_mao_tiers()
+        tiers = tiers_future.result()
         if not tiers.empty:
-            df = df.merge(
-                tiers[["County_key", "MAO_Tier", "MAO_Range_Str"]],
-                on="County_key",
-                how="left",
+            # Tiny per-county lookups (first row wins if a county is listed twice).
+            # County_key is categorical, so map() resolves each county once and
+            # broadcasts by code; no merge/join indexer over the deals rows.
+            if not tiers["County_key"].is_unique:
+                tiers = tiers.drop_duplicates("County_key", keep="first")
+            tiers_by_key = tiers.set_index("County_key")
+            tier_by_key = tiers_by_key["MAO_Tier"].astype(str).to_dict()
+            range_by_key = tiers_by_key["MAO_Range_Str"].to_dict()
+            df = df.assign(
+                MAO_Tier=df["County_key"].map(tier_by_key).astype("category"),
+                MAO_Range_Str=df["County_key"].map(range_by_key).astype("category"),
             )
     except Exception as e:
         # Internal app: keep running, but surface what happened.
         st.warning(f"Could not load/merge MAO tiers (showing blank tiers). Details: {type(e).__name__}")
-        df["MAO_Tier"] = ""
-        df["MAO_Range_Str"] = ""
+        df = df.assign(MAO_Tier="", MAO_Range_Str="")  # never write into the cached deals frame
 
+    # Fresh token per load (shallow copy so the cached deals frame isn't touched):
+    # caches keyed on this frame use it because id() can be reused by a later load
+    df = df.copy(deep=False)
+    df.attrs[LOAD_TOKEN_ATTR] = uuid.uuid4().hex
     return df
@@ -2,23 +2,30 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 import pandas as pd
 
 
+@lru_cache(maxsize=None)
+def county_title(county_up: str) -> str:
+    """Display name for an UPPERCASE county key (memoized; ~95 TN counties)."""
+    return str(county_up).title()
+
+
 def build_top_buyers_dict(df_time_sold: pd.DataFrame) -> Dict[str, List[Tuple[str, int]]]:
     """Top buyers per county (sold only)."""
-    df_sold_all = df_time_sold[df_time_sold["Buyer_clean"] != ""].copy()
+    df_sold_all = df_time_sold[df_time_sold["Buyer_clean"] != ""]
 
     buyers_by_county = (
-        df_sold_all.groupby(["County_clean_up", "Buyer_clean"])
+        df_sold_all.groupby(["County_clean_up", "Buyer_clean"], observed=True)
         .size()
         .reset_index(name="Count")
     )
 
     top_buyers: Dict[str, List[Tuple[str, int]]] = {}
-    for county, g in buyers_by_county.groupby("County_clean_up"):
+    for county, g in buyers_by_county.groupby("County_clean_up", observed=True):
         g_sorted = g.sort_values("Count", ascending=False)
         top_buyers[county] = list(
             zip(g_sorted["Buyer_clean"].tolist(), g_sorted["Count"].tolist())
@@ -115,7 +122,7 @@ def enrich_geojson_dispo(
         close_rate_str = str(props.get("CLOSE_RATE_STR", "N/A"))
 
         lines: List[str] = [
-            f"<div style='font-size:14px;'><b>{name.title()} County</b></div>",
+            f"<div style='font-size:14px;'><b>{county_title(name)} County</b></div>",
             "<div style='margin-top:4px;'>",
             f"<span style='color:#238b45;'>●</span> <b>Sold:</b> {sold} &nbsp; ",
             f"<span style='color:#cb181d;'>●</span> <b>Cut loose:</b> {cut}<br>",
@@ -183,7 +190,7 @@ def enrich_geojson_admin(
         close_rate_str = str(props.get("CLOSE_RATE_STR", "N/A"))
 
         lines: List[str] = [
-            f"<div style='font-size:14px;'><b>{name.title()} County</b></div>",
+            f"<div style='font-size:14px;'><b>{county_title(name)} County</b></div>",
             "<div style='margin-top:4px;'>",
             f"<span style='color:#238b45;'>●</span> <b>Sold:</b> {sold} &nbsp; ",
             f"<span style='color:#cb181d;'>●</span> <b>Cut loose:</b> {cut}<br>",
@@ -252,7 +259,7 @@ def enrich_geojson_acq(
         mao_range = props.get("MAO_RANGE", "")
 
         lines: List[str] = [
-            f"<div style='font-size:14px;'><b>{name.title()} County</b></div>",
+            f"<div style='font-size:14px;'><b>{county_title(name)} County</b></div>",
             "<div style='margin-top:4px;'>",
             f"<span style='color:#238b45;'>●</span> <b>Sold:</b> {sold} &nbsp; ",
             f"<span style='color:#cb181d;'>●</span> <b>Cut loose:</b> {cut}<br>",
@@ -1,6 +1,7 @@
 # filters.py
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
+import numpy as np
 import pandas as pd
 from data.momentum import compute_buyer_momentum
 
@@ -26,52 +27,50 @@ def get_years_available(df: pd.DataFrame) -> List[int]:
     return sorted(ys)
 
 def split_by_year(df: pd.DataFrame, year_choice) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    df_time = df.copy()
+    # One mask per status, one gather per frame (boolean indexing already
+    # returns new frames, so no defensive copies / concats are needed).
+    is_sold = df["Status_norm"] == "sold"
+    is_cut = df["Status_norm"] == "cut loose"
 
     if year_choice == "Last 12 months":
-        # Rolling 12 months ending today (based on the Date column).
-        if "Date" not in df_time.columns:
-            # Safety fallback: if Date is missing, behave like "All years".
-            df_sold = df_time[df_time["Status_norm"] == "sold"].copy()
-            df_cut = df_time[df_time["Status_norm"] == "cut loose"].copy()
-        else:
+        # Rolling 12 months ending today (based on the Date_dt parsed by load_data).
+        if "Date_dt" in df.columns:
             end_date = pd.Timestamp.today().normalize()
             start_date = end_date - pd.DateOffset(months=12)
 
-            sold_mask = (
-                (df_time["Status_norm"] == "sold")
-                & (df_time["Date"].notna())
-                & (df_time["Date"] >= start_date)
-            )
-            df_sold = df_time[sold_mask].copy()
-
-            cut_mask = df_time["Status_norm"] == "cut loose"
-            cut_in_window = cut_mask & (df_time["Date"].notna()) & (df_time["Date"] >= start_date)
-            cut_no_date = cut_mask & df_time["Date"].isna()  # keep undated cut-loose records
-            df_cut = pd.concat([df_time[cut_in_window], df_time[cut_no_date]], ignore_index=True)
+            dates = df["Date_dt"]
+            in_window = dates.notna() & (dates >= start_date)
+            is_sold &= in_window
+            is_cut &= in_window | dates.isna()  # keep undated cut-loose records
+        # Safety fallback: if Date_dt is missing, behave like "All years".
 
     elif year_choice != "All years":
         y = int(year_choice)
-        df_sold = df_time[(df_time["Status_norm"] == "sold") & (df_time["Year"] == y)].copy()
-
-        cut_mask = df_time["Status_norm"] == "cut loose"
-        cut_has_year = cut_mask & df_time["Year"].notna()
-        cut_no_year = cut_mask & df_time["Year"].isna()
-
-        df_cut = pd.concat(
-            [df_time[cut_has_year & (df_time["Year"] == y)], df_time[cut_no_year]],
-            ignore_index=True,
-        )
-    else:
-        df_sold = df_time[df_time["Status_norm"] == "sold"].copy()
-        df_cut = df_time[df_time["Status_norm"] == "cut loose"].copy()
+        in_year = df["Year"] == y
+        is_sold &= in_year
+        is_cut &= in_year | df["Year"].isna()  # keep undated cut-loose records
 
+    df_sold = df[is_sold]
+    df_cut = df[is_cut]
     df_both = pd.concat([df_sold, df_cut], ignore_index=True)
     return df_sold, df_cut, df_both
 
+def option_values(series: pd.Series) -> List[str]:
+    """Sorted, non-blank unique values of a column (for dropdown options).
+
+    Categorical columns (normalize_inputs builds them from stripped strings,
+    so categories are already sorted) are answered from their used
+    categories without stringifying or re-sorting anything.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        used = series.cat.remove_unused_categories().cat.categories
+        return [v for v in used.tolist() if v != ""]
+    values = pd.unique(series.dropna().to_numpy())
+    return sorted({str(v).strip() for v in values} - {""})
+
 def buyer_options(df_time_sold: pd.DataFrame):
     bm = compute_buyer_momentum(df_time_sold)
-    buyers_plain = sorted([b for b in df_time_sold["Buyer_clean"].astype(str).str.strip().unique().tolist() if b])
+    buyers_plain = option_values(df_time_sold["Buyer_clean"])
     return buyers_plain, bm
 
 def build_buyer_labels(buyer_momentum: pd.DataFrame, buyers_plain: List[str]):
@@ -80,11 +79,19 @@ def build_buyer_labels(buyer_momentum: pd.DataFrame, buyers_plain: List[str]):
 
     if not buyer_momentum.empty:
         bm = buyer_momentum.sort_values(["last12", "delta"], ascending=False)
-        for b, row in bm.iterrows():
-            d = int(row["delta"])
-            arrow = "▲" if d > 0 else ("▼" if d < 0 else "→")
-            labels.append(f"{b}  {arrow} {d:+d}  ({int(row['last12'])} vs {int(row['prev12'])})")
-            label_to_buyer[labels[-1]] = b
+        # "<buyer>  ▲ +3  (5 vs 2)" for every buyer at once (column-wise string ops, no iterrows)
+        d = bm["delta"].astype(int).to_numpy()
+        arrow = np.where(d > 0, "▲", np.where(d < 0, "▼", "→"))
+        sign = np.where(d < 0, "-", "+")
+        names = pd.Series(bm.index.astype(str), dtype=str)
+        label_s = (
+            names + "  " + arrow + " " + sign + pd.Series(np.abs(d)).astype(str)
+            + "  (" + pd.Series(bm["last12"].astype(int).to_numpy()).astype(str)
+            + " vs " + pd.Series(bm["prev12"].astype(int).to_numpy()).astype(str) + ")"
+        )
+        new_labels = label_s.tolist()
+        labels.extend(new_labels)
+        label_to_buyer.update(zip(new_labels, bm.index.tolist()))
     else:
         for b in buyers_plain:
             labels.append(b)
@@ -93,26 +100,28 @@ def build_buyer_labels(buyer_momentum: pd.DataFrame, buyers_plain: List[str]):
     return labels, label_to_buyer
 
 def build_view_df(df_time_sold: pd.DataFrame, df_time_cut: pd.DataFrame, sel: Selection) -> pd.DataFrame:
-    if sel.mode == "Sold":
-        df_view = df_time_sold.copy()
-        if sel.buyer_active:
-            df_view = df_view[df_view["Buyer_clean"] == sel.buyer_choice]
-        return df_view
+    # Read-only slices of the split frames; consumers never mutate df_view in place.
+    df_sold = df_time_sold
+    if sel.buyer_active and sel.mode in ("Sold", "Both"):
+        df_sold = df_sold[df_sold["Buyer_clean"].values == sel.buyer_choice]
 
+    if sel.mode == "Sold":
+        return df_sold
     if sel.mode == "Cut Loose":
-        return df_time_cut.copy()
-
-    df_sold = df_time_sold.copy()
-    if sel.buyer_active:
-        df_sold = df_sold[df_sold["Buyer_clean"] == sel.buyer_choice]
-    return pd.concat([df_sold, df_time_cut.copy()], ignore_index=True)
+        return df_time_cut
+    return pd.concat([df_sold, df_time_cut], ignore_index=True)
 
 def compute_overall_stats(df_time_sold: pd.DataFrame, df_time_cut: pd.DataFrame) -> Dict[str, object]:
     sold_total = int(len(df_time_sold))
     cut_total = int(len(df_time_cut))
     total_deals = sold_total + cut_total
 
-    total_buyers = int(df_time_sold.loc[df_time_sold["Buyer_clean"] != "", "Buyer_clean"].nunique())
+    buyers = df_time_sold["Buyer_clean"]
+    if isinstance(buyers.dtype, pd.CategoricalDtype):
+        # Used categories, as in buyer_options (no row gather + hash)
+        total_buyers = len(option_values(buyers))
+    else:
+        total_buyers = int(buyers[buyers != ""].nunique())
 
     close_rate = (sold_total / total_deals) if total_deals > 0 else None
     close_rate_str = f"{close_rate*100:.1f}%" if close_rate is not None else "N/A"
@@ -125,9 +134,17 @@ def compute_overall_stats(df_time_sold: pd.DataFrame, df_time_cut: pd.DataFrame)
         close_rate_str=close_rate_str,
     )
 
-def prepare_filtered_data(df: pd.DataFrame, year_choice) -> FilteredData:
+def prepare_filtered_data(df: pd.DataFrame, year_choice, *, with_buyer_options: bool = True) -> FilteredData:
+    """Year split + (optionally) buyer dropdown inputs.
+
+    Views without a buyer filter pass with_buyer_options=False to skip the
+    buyer momentum pass.
+    """
     df_time_sold, df_time_cut, df_time_filtered = split_by_year(df, year_choice)
-    buyers_plain, buyer_momentum = buyer_options(df_time_sold)
+    if with_buyer_options:
+        buyers_plain, buyer_momentum = buyer_options(df_time_sold)
+    else:
+        buyers_plain, buyer_momentum = [], pd.DataFrame(columns=["last12", "prev12", "delta"])
     return FilteredData(
         df_time_sold=df_time_sold,
         df_time_cut=df_time_cut,
@@ -1,23 +1,45 @@
 # momentum.py
+import numpy as np
 import pandas as pd
 
 def compute_buyer_momentum(df_time_sold: pd.DataFrame) -> pd.DataFrame:
-    sold = df_time_sold.copy()
-    sold["Buyer_clean"] = sold["Buyer_clean"].fillna("").astype(str).str.strip()
+    # Read-only: work on local arrays instead of copying the frame
+    dates = df_time_sold["Date_dt"]
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        # numpy can't sort/compare tz-aware values; the windows are relative, so naive UTC is equivalent
+        dates = dates.dt.tz_convert(None)
+    buyers = df_time_sold["Buyer_clean"].fillna("").astype(str).str.strip().to_numpy()
 
-    anchor = sold["Date_dt"].max()
+    anchor = dates.max()
     if pd.isna(anchor):
         anchor = pd.Timestamp.today()
 
     last12_start = anchor - pd.Timedelta(days=365)
     prev12_start = anchor - pd.Timedelta(days=730)
 
-    df_last12 = sold[(sold["Date_dt"] > last12_start) & (sold["Date_dt"] <= anchor)]
-    df_prev12 = sold[(sold["Date_dt"] > prev12_start) & (sold["Date_dt"] <= last12_start)]
+    # Sort the dates once (NaT sorts last) and find both windows with binary
+    # searches instead of scanning the column with boolean masks.
+    dt = dates.to_numpy()
+    order = np.argsort(dt, kind="stable")
+    dt_sorted = dt[order]
+    bounds = np.array([prev12_start, last12_start, anchor], dtype="datetime64[ns]").astype(dt.dtype)
+    i_prev, i_last, i_end = np.searchsorted(dt_sorted, bounds, side="right")
 
-    last12_counts = df_last12[df_last12["Buyer_clean"] != ""].groupby("Buyer_clean").size()
-    prev12_counts = df_prev12[df_prev12["Buyer_clean"] != ""].groupby("Buyer_clean").size()
+    bucket = np.empty(len(order), dtype=object)
+    bucket[:] = ""
+    bucket[i_prev:i_last] = "prev12"
+    bucket[i_last:i_end] = "last12"
+    buyers = buyers[order]
 
-    bm = pd.DataFrame({"last12": last12_counts, "prev12": prev12_counts}).fillna(0).astype(int)
+    keep = (bucket != "") & (buyers != "")
+
+    counts = (
+        pd.DataFrame({"Buyer_clean": buyers[keep], "bucket": bucket[keep]})
+        .groupby(["Buyer_clean", "bucket"])
+        .size()
+        .unstack(fill_value=0)
+    )
+    bm = counts.reindex(columns=["last12", "prev12"], fill_value=0).astype(int)
+    bm.columns.name = None
     bm["delta"] = bm["last12"] - bm["prev12"]
     return bm
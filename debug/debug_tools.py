@@ -11,13 +11,16 @@ Usage:
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 import streamlit as st
 
 
 _LOG_KEY = "debug_log"
+_LOG_MAX = 250  # oldest events are evicted past this
 
 
 def is_debug_mode() -> bool:
@@ -43,8 +46,11 @@ def debug_event(name: str, **fields: Any) -> None:
     if not is_debug_mode():
         return
 
-    st.session_state.setdefault(_LOG_KEY, [])
-    st.session_state[_LOG_KEY].append(
+    log = st.session_state.get(_LOG_KEY)
+    if not isinstance(log, deque):
+        # Bounded ring buffer: appends are O(1), no re-slicing to cap growth
+        log = st.session_state[_LOG_KEY] = deque(log or (), maxlen=_LOG_MAX)
+    log.append(
         {
             "ts": datetime.utcnow().isoformat(timespec="seconds") + "Z",
             "name": str(name),
@@ -52,10 +58,6 @@ def debug_event(name: str, **fields: Any) -> None:
         }
     )
 
-    # Prevent unbounded growth
-    if len(st.session_state[_LOG_KEY]) > 250:
-        st.session_state[_LOG_KEY] = st.session_state[_LOG_KEY][-250:]
-
 
 def render_debug_panel() -> None:
     """Render a sidebar panel with recent debug events + key session state."""
@@ -70,7 +72,7 @@ def render_debug_panel() -> None:
             st.info("No debug events yet.")
         else:
             st.caption(f"Events: {len(logs)} (showing last 25)")
-            for e in logs[-25:][::-1]:
+            for e in islice(reversed(logs), 25):
                 st.write(f"**{e['ts']}** — `{e['name']}`")
                 if e.get("fields"):
                     st.json(e["fields"], expanded=False)
@@ -6,8 +6,11 @@ as much as possible (logic + data transformations).
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from data.enrich import county_title
+
 
 def county_options(
     df: pd.DataFrame, tiers: pd.DataFrame | None
@@ -23,11 +26,14 @@ def county_options(
     tier_counties: list[str] = []
     if tiers is not None and not tiers.empty:
         # Tier sheet should cover all TN counties (preferred for dropdown)
-        mao_tier_by_county = dict(zip(tiers["County_clean_up"], tiers["MAO_Tier"]))
-        mao_range_by_county = dict(zip(tiers["County_clean_up"], tiers["MAO_Range_Str"]))
-        tier_counties = sorted(tiers["County_clean_up"].dropna().unique().tolist())
-
-    deal_counties = sorted(df.get("County_clean_up", pd.Series(dtype=str)).dropna().unique().tolist())
+        # Zip raw arrays (not Series) and let np.unique sort + dedupe in one call
+        ccu = tiers["County_clean_up"].to_numpy()
+        mao_tier_by_county = dict(zip(ccu, tiers["MAO_Tier"].to_numpy()))
+        mao_range_by_county = dict(zip(ccu, tiers["MAO_Range_Str"].to_numpy()))
+        tier_counties = np.unique(ccu[pd.notna(ccu)]).tolist()
+
+    deal_ccu = df.get("County_clean_up", pd.Series(dtype=str)).to_numpy()
+    deal_counties = np.unique(deal_ccu[pd.notna(deal_ccu)]).tolist()
     all_county_options = tier_counties if tier_counties else deal_counties
 
     return all_county_options, mao_tier_by_county, mao_range_by_county
@@ -41,26 +47,32 @@ def apply_admin_filters(
     acq_rep_choice: str,
     dispo_rep_choice_admin: str,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Apply Admin-only filters to sold/cut frames."""
-    df_sold_f = df_sold
-    df_cut_f = df_cut
+    """Apply Admin-only filters to sold/cut frames.
 
-    if dispo_rep_choice_admin not in ("All reps", "All dispo reps") and "Dispo_Rep_clean" in df_sold_f.columns:
-        df_sold_f = df_sold_f[df_sold_f["Dispo_Rep_clean"] == dispo_rep_choice_admin]
-        if "Dispo_Rep_clean" in df_cut_f.columns:
-            df_cut_f = df_cut_f[df_cut_f["Dispo_Rep_clean"] == dispo_rep_choice_admin]
+    Builds one boolean mask per frame and slices once (instead of one
+    DataFrame copy per active filter).
+    """
+    active: list[tuple[str, str]] = []
+    if dispo_rep_choice_admin not in ("All reps", "All dispo reps"):
+        active.append(("Dispo_Rep_clean", dispo_rep_choice_admin))
+    if market_choice != "All markets":
+        active.append(("Market_clean", market_choice))
+    if acq_rep_choice != "All acquisition reps":
+        active.append(("Acquisition_Rep_clean", acq_rep_choice))
 
-    if market_choice != "All markets" and "Market_clean" in df_sold_f.columns:
-        df_sold_f = df_sold_f[df_sold_f["Market_clean"] == market_choice]
-        if "Market_clean" in df_cut_f.columns:
-            df_cut_f = df_cut_f[df_cut_f["Market_clean"] == market_choice]
+    # A filter only applies when the sold frame has the column (cut follows if it has it too)
+    active = [(col, value) for col, value in active if col in df_sold.columns]
+    if not active:
+        return df_sold, df_cut
 
-    if acq_rep_choice != "All acquisition reps" and "Acquisition_Rep_clean" in df_sold_f.columns:
-        df_sold_f = df_sold_f[df_sold_f["Acquisition_Rep_clean"] == acq_rep_choice]
-        if "Acquisition_Rep_clean" in df_cut_f.columns:
-            df_cut_f = df_cut_f[df_cut_f["Acquisition_Rep_clean"] == acq_rep_choice]
+    mask_sold = np.ones(len(df_sold), dtype=bool)
+    mask_cut = np.ones(len(df_cut), dtype=bool)
+    for col, value in active:
+        mask_sold &= df_sold[col].values == value
+        if col in df_cut.columns:
+            mask_cut &= df_cut[col].values == value
 
-    return df_sold_f, df_cut_f
+    return df_sold[mask_sold], df_cut[mask_cut]
 
 
 def compute_sold_cut_counts(
@@ -95,16 +107,21 @@ def compute_sold_cut_counts(
         and dispo_rep_choice != "All reps"
         and "Dispo_Rep_clean" in df_conv.columns
     ):
-        df_conv = df_conv[df_conv["Dispo_Rep_clean"] == dispo_rep_choice]
+        df_conv = df_conv[df_conv["Dispo_Rep_clean"].values == dispo_rep_choice]
 
 
-    df_conv = df_conv.dropna(subset=["County_clean_up"]).copy()
-    df_conv["is_sold"] = df_conv["Status_norm"].eq("sold")
-    df_conv["is_cut"] = df_conv["Status_norm"].eq("cut loose")
+    df_conv = df_conv.dropna(subset=["County_clean_up"])
 
-    grp = df_conv.groupby("County_clean_up", dropna=True)
-    sold_counts = grp["is_sold"].sum().astype(int).to_dict()
-    cut_counts = grp["is_cut"].sum().astype(int).to_dict()
+    # One (county, status) groupby gives both counts; every county keeps a row (0 if absent)
+    pivot = (
+        df_conv.groupby(["County_clean_up", "Status_norm"], dropna=False, observed=True, sort=False)
+        .size()
+        .unstack(fill_value=0)
+    )
+    pivot.columns = pivot.columns.astype(str)
+    pivot = pivot.reindex(columns=["sold", "cut loose"], fill_value=0)
+    sold_counts = pivot["sold"].astype(int).to_dict()
+    cut_counts = pivot["cut loose"].astype(int).to_dict()
 
     return sold_counts, cut_counts
 
@@ -128,7 +145,7 @@ def build_rank_df(
 
         rows.append(
             {
-                "County": c.title(),
+                "County": county_title(c),
                 "Sold": sold,
                 "Cut loose": cut,
                 "Total": total,
@@ -141,6 +158,18 @@ def build_rank_df(
     return pd.DataFrame(rows)
 
 
+def _as_numeric(s: pd.Series | None) -> pd.Series | None:
+    """Coerce to numbers, skipping the per-element coerce path when already numeric."""
+    if s is None or pd.api.types.is_numeric_dtype(s):
+        return s
+    return pd.to_numeric(s, errors="coerce")
+
+
+def _mean_from_sum_count(total: pd.Series, n: pd.Series) -> pd.Series:
+    """Mean derived from a groupby sum + count (0 where a group has no values)."""
+    return (total / n.where(n > 0)).fillna(0)
+
+
 def compute_gp_by_county(df_sold: pd.DataFrame) -> tuple[dict[str, float], dict[str, float]]:
     """Compute total GP and avg GP per county (SOLD only)."""
     if df_sold is None or df_sold.empty:
@@ -153,9 +182,10 @@ def compute_gp_by_county(df_sold: pd.DataFrame) -> tuple[dict[str, float], dict[
     df["Gross_Profit_num"] = pd.to_numeric(df["Gross_Profit"], errors="coerce")
     df = df.dropna(subset=["County_clean_up"])
 
-    grp = df.groupby("County_clean_up")["Gross_Profit_num"]
-    gp_total = grp.sum(min_count=1).fillna(0)
-    gp_avg = grp.mean().fillna(0)
+    # One pass: sum + count, then derive the mean (0 when a county has no GP values)
+    agg = df.groupby("County_clean_up", observed=True, sort=False)["Gross_Profit_num"].agg(["sum", "count"])
+    gp_total = agg["sum"]
+    gp_avg = _mean_from_sum_count(agg["sum"], agg["count"])
 
     return gp_total.to_dict(), gp_avg.to_dict()
 
@@ -181,24 +211,27 @@ def build_admin_metrics(df_time_sold_for_view: pd.DataFrame) -> tuple[pd.DataFra
     gp_total_by_county, gp_avg_by_county = compute_gp_by_county(df_admin_sold_only)
 
     sold_deals_by_county = (
-        df_admin_sold_only.groupby("County_clean_up").size().to_dict()
+        df_admin_sold_only.groupby("County_clean_up", observed=True, sort=False).size().to_dict()
         if "County_clean_up" in df_admin_sold_only.columns and not df_admin_sold_only.empty
         else {}
     )
 
-    rows: list[dict] = []
-    counties = sorted(set(list(gp_total_by_county.keys()) + list(sold_deals_by_county.keys())))
-    for county_up in counties:
-        rows.append(
-            {
-                "County": str(county_up).title(),
-                "Total GP": float(gp_total_by_county.get(county_up, 0.0) or 0.0),
-                "Avg GP": float(gp_avg_by_county.get(county_up, 0.0) or 0.0),
-                "Sold Deals": int(sold_deals_by_county.get(county_up, 0) or 0),
-            }
+    # Outer-align the per-county series (sorted by county) instead of looping in Python
+    admin_rank_df = (
+        pd.concat(
+            [
+                pd.Series(gp_total_by_county, name="Total GP", dtype="float64"),
+                pd.Series(gp_avg_by_county, name="Avg GP", dtype="float64"),
+                pd.Series(sold_deals_by_county, name="Sold Deals", dtype="float64"),
+            ],
+            axis=1,
         )
-
-    admin_rank_df = pd.DataFrame(rows)
+        .fillna(0)
+        .sort_index()
+    )
+    admin_rank_df["Sold Deals"] = admin_rank_df["Sold Deals"].astype(int)
+    admin_rank_df.insert(0, "County", admin_rank_df.index.map(county_title))
+    admin_rank_df = admin_rank_df.reset_index(drop=True)
     return admin_rank_df, gp_total_by_county, gp_avg_by_county
 
 
@@ -207,20 +240,21 @@ def compute_admin_headline_metrics(df_sold_only: pd.DataFrame) -> dict[str, floa
     if df_sold_only is None or df_sold_only.empty:
         return {"total_gp": 0.0, "total_wholesale": 0.0, "sold_count": 0, "avg_gp": 0.0}
 
-    df = df_sold_only.copy()
+    # Read-only: no defensive copy needed
+    df = df_sold_only
 
-    gp = pd.to_numeric(df.get("Gross_Profit"), errors="coerce").fillna(0)
-    total_gp = float(gp.sum())
+    gp = _as_numeric(df.get("Gross_Profit"))
+    total_gp = float(np.nansum(gp.to_numpy(dtype="float64"))) if gp is not None else 0.0
 
     # Wholesale: prefer Wholesale_Price_num, else Wholesale_Price if present
     if "Wholesale_Price_num" in df.columns:
-        wholesale = pd.to_numeric(df["Wholesale_Price_num"], errors="coerce").fillna(0)
+        wholesale = _as_numeric(df["Wholesale_Price_num"])
     elif "Wholesale_Price" in df.columns:
-        wholesale = pd.to_numeric(df["Wholesale_Price"], errors="coerce").fillna(0)
+        wholesale = _as_numeric(df["Wholesale_Price"])
     else:
-        wholesale = pd.Series([0] * len(df), dtype="float")
+        wholesale = None
 
-    total_wholesale = float(wholesale.sum())
+    total_wholesale = float(np.nansum(wholesale.to_numpy(dtype="float64"))) if wholesale is not None else 0.0
     sold_count = int(len(df))
     avg_gp = float(total_gp / sold_count) if sold_count else 0.0
 
@@ -246,33 +280,43 @@ def build_county_gp_table(df_sold_only: pd.DataFrame) -> pd.DataFrame:
     if "County_clean_up" not in df_sold_only.columns:
         return pd.DataFrame(columns=cols)
 
-    df = df_sold_only.copy()
-    df = df.dropna(subset=["County_clean_up"]).copy()
+    df = df_sold_only.dropna(subset=["County_clean_up"]).copy()
 
-    # Numeric conversions once
-    df["Gross_Profit_num"] = pd.to_numeric(df.get("Gross_Profit"), errors="coerce")
+    # Numeric conversions once (skipped when the column is already numeric)
+    df["Gross_Profit_num"] = _as_numeric(df.get("Gross_Profit"))
 
     if "Wholesale_Price_num" in df.columns:
-        df["Wholesale_num"] = pd.to_numeric(df["Wholesale_Price_num"], errors="coerce")
+        df["Wholesale_num"] = _as_numeric(df["Wholesale_Price_num"])
     elif "Wholesale_Price" in df.columns:
-        df["Wholesale_num"] = pd.to_numeric(df["Wholesale_Price"], errors="coerce")
+        df["Wholesale_num"] = _as_numeric(df["Wholesale_Price"])
     else:
         df["Wholesale_num"] = pd.NA
 
-    grp = df.groupby("County_clean_up", dropna=True)
+    grp = df.groupby("County_clean_up", dropna=True, observed=True, sort=False)
+
+    # Single groupby emits sum + count for GP (and Wholesale); means are derived from those
+    has_wholesale = bool(df["Wholesale_num"].notna().any())
+    num_cols = ["Gross_Profit_num", "Wholesale_num"] if has_wholesale else ["Gross_Profit_num"]
+    agg = grp[num_cols].agg(["sum", "count"])
+
+    sizes = grp.size()
 
     out = pd.DataFrame(
         {
-            "County": grp.size().index.astype(str).str.title(),
-            "Sold Deals": grp.size().astype(int).values,
-            "Total GP": grp["Gross_Profit_num"].sum(min_count=1).fillna(0).values,
-            "Avg GP": grp["Gross_Profit_num"].mean().fillna(0).values,
+            "County": sizes.index.astype(str).map(county_title),
+            "Sold Deals": sizes.astype(int).to_numpy(),
+            "Total GP": agg[("Gross_Profit_num", "sum")].values,
+            "Avg GP": _mean_from_sum_count(
+                agg[("Gross_Profit_num", "sum")], agg[("Gross_Profit_num", "count")]
+            ).values,
         }
     )
 
-    if df["Wholesale_num"].notna().any():
-        out["Total Wholesale"] = grp["Wholesale_num"].sum(min_count=1).fillna(0).values
-        out["Avg Wholesale"] = grp["Wholesale_num"].mean().fillna(0).values
+    if has_wholesale:
+        out["Total Wholesale"] = agg[("Wholesale_num", "sum")].values
+        out["Avg Wholesale"] = _mean_from_sum_count(
+            agg[("Wholesale_num", "sum")], agg[("Wholesale_num", "count")]
+        ).values
     else:
         # keep columns present but empty to simplify downstream
         out["Total Wholesale"] = 0.0
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+import ui.controls as controls
+from data.data import normalize_inputs
+from ui.controls import MAX_SELECT_OPTIONS, ensure_year_column, with_all_option
+
+
+def _load_data_like_frame() -> pd.DataFrame:
+    raw = pd.DataFrame(
+        {
+            "Address": ["1 Main St", "2 Oak Ave"],
+            "City": ["Nashville", "Memphis"],
+            "County": ["Davidson County", "Shelby"],
+            "Salesforce_URL": ["u1", "u2"],
+            "Status": ["Sold", "Cut Loose"],
+            "Date": ["1/5/2024", ""],
+        }
+    )
+    return normalize_inputs(raw)
+
+
+def test_ensure_year_column_is_a_no_op_for_the_loaded_frame():
+    df = _load_data_like_frame()
+
+    assert ensure_year_column(df) is df
+    assert df["Date"].tolist()[0] == pd.Timestamp("2024-01-05")
+    assert df["Year"].tolist()[0] == 2024
+
+
+def test_ensure_year_column_still_coerces_raw_frames():
+    df = pd.DataFrame({"Date": ["2024-01-05", "bad"]})
+
+    out = ensure_year_column(df)
+
+    assert out is not df
+    assert pd.api.types.is_datetime64_any_dtype(out["Date"])
+    assert out["Year"].tolist()[0] == 2024 and pd.isna(out["Year"].iloc[1])
+
+
+def _fake_streamlit(monkeypatch, *, session_state, query=""):
+    captions = []
+    fake = SimpleNamespace(
+        session_state=session_state,
+        text_input=lambda *args, **kwargs: query,
+        caption=captions.append,
+    )
+    monkeypatch.setattr(controls, "st", fake)
+    return captions
+
+
+def test_with_all_option_keeps_the_saved_choice_past_the_cap(monkeypatch):
+    values = [f"REP {i:04d}" for i in range(MAX_SELECT_OPTIONS + 200)]
+    captions = _fake_streamlit(monkeypatch, session_state={"rep_choice": "REP 0650"})
+
+    options = with_all_option(("All reps",), values, "reps", key="rep_choice")
+
+    assert options[:2] == ("All reps", "REP 0000")
+    assert options[-1] == "REP 0650"
+    assert len(options) == 1 + MAX_SELECT_OPTIONS + 1
+    assert captions == [f"Showing the first {MAX_SELECT_OPTIONS} of {MAX_SELECT_OPTIONS + 200} reps (200 hidden); type to narrow."]
+
+
+def test_with_all_option_leaves_short_lists_and_unknown_choices_alone(monkeypatch):
+    captions = _fake_streamlit(monkeypatch, session_state={"rep_choice": "GONE"})
+
+    assert with_all_option(("All reps",), ["A", "B"], "reps", key="rep_choice") == ("All reps", "A", "B")
+
+    values = [f"REP {i:04d}" for i in range(MAX_SELECT_OPTIONS + 1)]
+    options = with_all_option(("All reps",), values, "reps", key="rep_choice")
+    assert "GONE" not in options and len(options) == 1 + MAX_SELECT_OPTIONS
+    assert captions[-1].endswith("(1 hidden); type to narrow.")
@@ -0,0 +1,200 @@
+import io
+import json
+
+import pandas as pd
+
+import data.data as data_mod
+from data.data import (
+    RAW_STR_DTYPE,
+    _is_deal_sheet_col,
+    _parse_csv,
+    _parse_dates,
+    _year_of,
+    normalize_inputs,
+    normalize_tiers,
+)
+from data.momentum import compute_buyer_momentum
+
+
+def test_parse_dates_tolerates_mixed_timezones():
+    # One offset-bearing ISO cell among US-style dates must not raise
+    raw = pd.Series(["03/01/2024", "2024-03-01T06:00:00Z", "not a date", None, "04/02/2024"])
+
+    dates = _parse_dates(raw)
+
+    assert dates.dt.tz is None
+    assert dates.tolist()[:2] == [pd.Timestamp("2024-03-01"), pd.Timestamp("2024-03-01 06:00")]
+    assert dates.iloc[2:4].isna().all()
+    assert dates.iloc[4] == pd.Timestamp("2024-04-02")
+
+
+def test_parse_dates_all_offset_cells_come_back_naive_utc():
+    dates = _parse_dates(pd.Series(["2024-03-01T00:00:00Z", "2024-06-01T00:00:00-05:00"]))
+
+    assert dates.dt.tz is None
+    assert dates.tolist() == [pd.Timestamp("2024-03-01"), pd.Timestamp("2024-06-01 05:00")]
+
+
+def test_year_of_matches_dt_year_for_naive_and_tz_aware_dates():
+    naive = pd.Series(pd.to_datetime(["2023-12-31 23:00", None, "1965-06-01 00:00"]))
+    aware = pd.Series(pd.to_datetime(["2023-12-31 23:00", "2024-01-01 01:00"])).dt.tz_localize("US/Central")
+
+    assert _year_of(naive).tolist()[::2] == [2023.0, 1965.0]
+    assert _year_of(naive).isna().tolist() == [False, True, False]
+    assert _year_of(aware).tolist() == aware.dt.year.tolist() == [2023, 2024]
+
+
+def test_buyer_momentum_same_for_naive_and_tz_aware_dates():
+    sold = pd.DataFrame(
+        {
+            "Date_dt": pd.to_datetime(["2024-06-01", "2024-01-15", "2023-03-01", "2022-01-01", None]),
+            "Buyer_clean": ["ACME", "ACME", "ACME", "BETA", "BETA"],
+        }
+    )
+    aware = sold.assign(Date_dt=sold["Date_dt"].dt.tz_localize("UTC"))
+
+    bm = compute_buyer_momentum(sold)
+
+    pd.testing.assert_frame_equal(compute_buyer_momentum(aware), bm)
+    assert bm.loc["ACME"].tolist() == [2, 1, 1]
+
+
+def test_parquet_cache_only_serves_the_revision_it_was_written_for(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_mod, "PARQUET_CACHE_PATH", str(tmp_path / "deals.parquet"))
+    df = pd.DataFrame({"County_clean_up": ["DAVIDSON", "SHELBY"], "Year": [2024.0, None]}).astype(
+        {"County_clean_up": "category"}
+    )
+
+    data_mod._write_parquet_cache(df, '"rev-1"')
+
+    assert data_mod._read_parquet_cache('"rev-2"') is None
+    pd.testing.assert_frame_equal(data_mod._read_parquet_cache('"rev-1"'), df)
+    assert [p.name for p in tmp_path.iterdir()] == ["deals.parquet"]  # no temp files left behind
+
+
+def test_parquet_cache_is_invalidated_by_a_schema_version_bump(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_mod, "PARQUET_CACHE_PATH", str(tmp_path / "deals.parquet"))
+    data_mod._write_parquet_cache(pd.DataFrame({"Year": [2024.0]}), '"rev-1"')
+
+    monkeypatch.setattr(data_mod, "PARQUET_CACHE_VERSION", data_mod.PARQUET_CACHE_VERSION + 1)
+
+    assert data_mod._read_parquet_cache('"rev-1"') is None
+
+
+def test_dispo_rep_alias_header_survives_parse_and_normalize():
+    csv_bytes = (
+        "Address,City,County,Salesforce_URL,Status, Dispo rep ,Notes\n"
+        "1 Main St,Nashville,Davidson County,u1,Sold,Ann,skip me\n"
+        "2 Oak Ave,Memphis,Shelby,u2,Cut Loose,,\n"
+    ).encode("utf-8")
+
+    raw = _parse_csv(io.BytesIO(csv_bytes), usecols=_is_deal_sheet_col, dtype=RAW_STR_DTYPE)
+    df = normalize_inputs(raw)
+
+    assert " Dispo rep " in raw.columns and "Notes" not in raw.columns
+    assert df.set_index("Address")["Dispo_Rep_clean"].astype(str).to_dict() == {"1 Main St": "Ann", "2 Oak Ave": ""}
+
+
+def test_normalize_tiers_range_strings_for_fraction_whole_and_missing_percentages():
+    tiers = pd.DataFrame(
+        {
+            "County": ["Davidson County", "Shelby", "Knox", "Blount", "Sevier"],
+            "Tier": ["A", "B", "C", "D", "E"],
+            "MAO Min": [0.73, 68, None, None, "0.7"],
+            "MAO Max": [0.77, None, 66, None, "75"],
+        }
+    )
+
+    out = normalize_tiers(tiers)
+
+    assert out["County_key"].astype(str).tolist() == ["DAVIDSON", "SHELBY", "KNOX", "BLOUNT", "SEVIER"]
+    # No "nan%" for missing bounds; fractions scale to whole percentages
+    assert out["MAO_Range_Str"].tolist() == ["73%–77%", "≥68%", "≤66%", "", "70%–75%"]
+
+
+def test_normalize_tiers_prefers_a_single_range_column():
+    tiers = pd.DataFrame({" county ": ["Knox"], "MAO Tier": ["A"], "Range": [" 70%-75% "], "Min": [0.1]})
+
+    out = normalize_tiers(tiers)
+
+    assert out["MAO_Tier"].astype(str).tolist() == ["A"]
+    assert out["MAO_Range_Str"].tolist() == ["70%-75%"]
+
+
+def test_parse_csv_keeps_wanted_columns_as_raw_strings():
+    csv_bytes = '\ufeffCounty,Price,Unused\nKnox,"$1,000",x\n,007,y\n'.encode("utf-8")
+
+    df = _parse_csv(io.BytesIO(csv_bytes), usecols={"County", "Price", "Missing"}, dtype=RAW_STR_DTYPE)
+
+    assert list(df.columns) == ["County", "Price"]  # BOM stripped, absent columns ignored
+    assert df["Price"].tolist() == ["$1,000", "007"]  # no numeric inference
+    assert df["County"].isna().tolist() == [False, True]  # blank cells are missing
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=b"", etag=None):
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+        self.raw = io.BytesIO(body)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSheet:
+    """Serves one CSV revision; answers 304 when If-None-Match carries its ETag."""
+
+    def __init__(self, body, etag):
+        self.body, self.etag = body, etag
+        self.sent = []
+        self.before_304 = None
+
+    def get(self, url, headers=None, **kwargs):
+        self.sent.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == self.etag:
+            if self.before_304:
+                self.before_304()
+            return _FakeResponse(304)
+        return _FakeResponse(200, self.body, self.etag)
+
+
+def test_read_csv_never_pairs_a_304_with_a_different_cached_body(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_mod, "CSV_CACHE_DIR", str(tmp_path))
+    sheet = _FakeSheet(b"County\nKnox\n", '"e1"')
+    monkeypatch.setattr(data_mod, "_SESSION", sheet)
+    url = "https://example.test/sheet.csv"
+    cache_path = data_mod._csv_cache_path(url)
+
+    assert data_mod._read_csv(url)["County"].tolist() == ["Knox"]
+    assert data_mod._read_csv(url)["County"].tolist() == ["Knox"]  # 304 -> disk copy
+    assert sheet.sent[-1] == {"If-None-Match": '"e1"'}
+
+    def stale_writer_wins():
+        # Another worker replaces the copy with an older revision while our request is in flight
+        with open(cache_path, "wb") as f:
+            f.write(json.dumps({"etag": '"e0"', "last_modified": None}).encode() + b"\nCounty\nShelby\n")
+
+    sheet.before_304 = stale_writer_wins
+
+    assert data_mod._read_csv(url)["County"].tolist() == ["Knox"]
+    assert sheet.sent[-1] == {}  # refetched unconditionally instead of trusting the 304
+    with open(cache_path, "rb") as f:
+        assert json.loads(f.readline())["etag"] == '"e1"'
+
+
+def test_read_csv_sends_no_validators_for_a_cache_file_without_them(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_mod, "CSV_CACHE_DIR", str(tmp_path))
+    sheet = _FakeSheet(b"County\nKnox\n", '"e1"')
+    monkeypatch.setattr(data_mod, "_SESSION", sheet)
+    url = "https://example.test/sheet.csv"
+    with open(data_mod._csv_cache_path(url), "wb") as f:
+        f.write(b"County\nShelby\n")  # bare body (e.g. the old body + .meta.json layout)
+
+    assert data_mod._read_csv(url)["County"].tolist() == ["Knox"]
+    assert sheet.sent == [{}]
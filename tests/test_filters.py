@@ -0,0 +1,60 @@
+import pandas as pd
+
+from data.filters import build_buyer_labels, split_by_year
+
+
+def _deals() -> pd.DataFrame:
+    today = pd.Timestamp.today().normalize()
+    dates = pd.Series(
+        [today - pd.Timedelta(days=10), today - pd.Timedelta(days=500), pd.NaT, today - pd.Timedelta(days=20), pd.NaT]
+    )
+    return pd.DataFrame(
+        {
+            "Address": ["recent sold", "old sold", "undated cut", "recent cut", "undated other"],
+            "Status_norm": pd.Categorical(["sold", "sold", "cut loose", "cut loose", ""]),
+            "Date_dt": dates,
+            "Year": dates.dt.year,
+        }
+    )
+
+
+def test_split_by_year_last_12_months_keeps_undated_cut_loose():
+    df_sold, df_cut, df_both = split_by_year(_deals(), "Last 12 months")
+
+    assert df_sold["Address"].tolist() == ["recent sold"]
+    assert df_cut["Address"].tolist() == ["undated cut", "recent cut"]
+    assert df_both["Address"].tolist() == ["recent sold", "undated cut", "recent cut"]
+
+
+def test_split_by_year_specific_and_all_years():
+    df = _deals()
+    old_year = str(int(df.loc[1, "Year"]))
+
+    df_sold, df_cut, _ = split_by_year(df, old_year)
+    assert df_sold["Address"].tolist() == ["old sold"]
+    assert "undated cut" in df_cut["Address"].tolist()
+
+    df_sold, df_cut, df_both = split_by_year(df, "All years")
+    assert len(df_sold) == 2 and len(df_cut) == 2 and len(df_both) == 4
+
+
+def test_build_buyer_labels_formats_momentum_and_falls_back_to_plain_names():
+    bm = pd.DataFrame(
+        {"last12": [5, 2, 3], "prev12": [2, 4, 3]},
+        index=pd.Index(["ACME", "BETA", "CORE"], name="Buyer_clean"),
+    )
+    bm["delta"] = bm["last12"] - bm["prev12"]
+
+    labels, label_to_buyer = build_buyer_labels(bm, [])
+
+    assert labels == [
+        "All buyers",
+        "ACME  ▲ +3  (5 vs 2)",
+        "CORE  → +0  (3 vs 3)",
+        "BETA  ▼ -2  (2 vs 4)",
+    ]
+    assert label_to_buyer["BETA  ▼ -2  (2 vs 4)"] == "BETA"
+
+    labels, label_to_buyer = build_buyer_labels(bm.iloc[:0], ["ACME", "BETA"])
+    assert labels == ["All buyers", "ACME", "BETA"]
+    assert label_to_buyer == {"All buyers": "All buyers", "ACME": "ACME", "BETA": "BETA"}
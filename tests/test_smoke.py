@@ -64,3 +64,28 @@ def test_compute_feasibility_support_fallback_uses_neighbors():
     assert result["support"]["used"] is True
     assert result["support"]["label"] in ("Nearby counties", "Statewide")
     assert result["support"]["n"] > 0
+
+
+def test_sold_cut_counts_with_categorical_columns():
+    df = pd.DataFrame(
+        {
+            "County_clean_up": ["DAVIDSON", "DAVIDSON", "SHELBY", "KNOX"],
+            "Status_norm": ["sold", "cut loose", "sold", ""],
+            "Dispo_Rep_clean": ["ALICE", "BOB", "ALICE", "BOB"],
+        }
+    ).astype("category")
+
+    df_sold = df[df["Status_norm"] == "sold"]
+    df_cut = df[df["Status_norm"] == "cut loose"]
+
+    sold_counts, cut_counts = compute_sold_cut_counts(
+        df_sold,
+        df_cut,
+        team_view="Dispo",
+        rep_active=False,
+        dispo_rep_choice="All reps",
+    )
+
+    # KNOX only exists as an unused category; it must not show up as a county
+    assert sold_counts == {"DAVIDSON": 1, "SHELBY": 1}
+    assert cut_counts == {"DAVIDSON": 1, "SHELBY": 0}
@@ -13,7 +13,8 @@ from dataclasses import dataclass
 import pandas as pd
 import streamlit as st
 
-from data.filters import build_buyer_labels, prepare_filtered_data
+from data.data import LOAD_TOKEN_ATTR
+from data.filters import build_buyer_labels, option_values, prepare_filtered_data
 
 
 @dataclass(frozen=True)
@@ -36,20 +37,120 @@ class ControlsResult:
     fd: object
 
 
+# "All ..." sentinels for the dropdowns; tuples so options are built by
+# tuple concatenation instead of fresh list copies each rerun.
+_ALL_BUYERS = ("All buyers",)
+_ALL_DISPO_REPS = ("All dispo reps",)
+_ALL_ACQ_REPS = ("All acquisition reps",)
+_ALL_MARKETS = ("All markets",)
+
+# Above this many options a selectbox gets sluggish; show a search box instead.
+MAX_SELECT_OPTIONS = 500
+
+
+@dataclass(frozen=True)
+class DropdownSpec:
+    label: str
+    column: str
+    all_option: tuple[str, ...]
+    noun: str  # plural, for the search box shown on very long lists
+
+
+# Admin filter row (col3..col5), all built from the loaded frame
+ADMIN_DROPDOWNS = (
+    DropdownSpec("Market", "Market_clean", _ALL_MARKETS, "markets"),
+    DropdownSpec("Acquisition Rep", "Acquisition_Rep_clean", _ALL_ACQ_REPS, "acquisition reps"),
+    DropdownSpec("Dispo rep", "Dispo_Rep_clean", _ALL_DISPO_REPS, "dispo reps"),
+)
+
+
+def with_all_option(all_option: tuple[str, ...], values, label: str, key: str | None = None) -> tuple[str, ...]:
+    """Prefix dropdown values with an "All ..." sentinel.
+
+    Very long lists are narrowed with a search-as-you-type box and capped at
+    MAX_SELECT_OPTIONS so the frontend payload stays small. Pass the
+    selectbox's key so its current choice stays offered even when it falls
+    past the cap (otherwise Streamlit silently resets the widget to "All ...").
+    """
+    values = tuple(values)
+    if len(values) > MAX_SELECT_OPTIONS:
+        current = st.session_state.get(key) if key else None
+        if current not in values:
+            current = None
+
+        query = st.text_input(f"Search {label}", key=f"{label}_option_search").strip().lower()
+        if query:
+            values = tuple(v for v in values if query in v.lower())
+        if len(values) > MAX_SELECT_OPTIONS:
+            total = len(values)
+            values = values[:MAX_SELECT_OPTIONS]
+            hidden = total - MAX_SELECT_OPTIONS
+            st.caption(f"Showing the first {MAX_SELECT_OPTIONS} of {total} {label} ({hidden} hidden); type to narrow.")
+        if current is not None and current not in values:
+            values += (current,)
+    return all_option + values
+
+
+def _loaded_frame_key(df: pd.DataFrame) -> tuple[int, str | None]:
+    """Cache key for a load_data() frame: its identity plus the per-load token it carries."""
+    return id(df), df.attrs.get(LOAD_TOKEN_ATTR)
+
+
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False, hash_funcs={pd.DataFrame: _loaded_frame_key})
+def frame_option_values(df: pd.DataFrame, col: str) -> tuple[str, ...]:
+    """option_values() for a column of a long-lived frame, cached by frame identity.
+
+    Only pass the cached load_data() frame here: it is keyed on id() plus the
+    token load_data stamps on every fresh load (no hashing of every row), so a
+    reloaded frame that happens to reuse a freed frame's id() still misses.
+    """
+    return tuple(option_values(df[col]))
+
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def cached_buyer_labels(buyer_momentum: pd.DataFrame, buyers_plain: tuple[str, ...]):
+    """build_buyer_labels() memoized on its (small, buyer-sized) inputs.
+
+    The labels only change when the year filter does, so widget clicks that
+    leave the year alone reuse the previous label list + mapping.
+    """
+    return build_buyer_labels(buyer_momentum, list(buyers_plain))
+
+
+def render_dropdown(spec: DropdownSpec, df: pd.DataFrame) -> str:
+    """Selectbox for spec.column of the loaded frame, "All ..." first."""
+    values = frame_option_values(df, spec.column) if spec.column in df.columns else ()
+    return st.selectbox(spec.label, with_all_option(spec.all_option, values, spec.noun), index=0)
+
+
 def ensure_year_column(df: pd.DataFrame, date_col: str = "Date") -> pd.DataFrame:
-    """Ensure df has a numeric Year column and a parsed datetime Date column."""
-    df = df.copy()
+    """Ensure df has a numeric Year column and a parsed datetime Date column.
 
-    if date_col in df.columns:
-        df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+    Returns df unchanged when both are already in shape, which is the case for
+    the load_data() frame (normalize_inputs stores the parsed Date). Otherwise
+    the coerced columns are assigned onto a new frame; note that assign copies
+    every column on pandas < 3 (no Copy-on-Write).
+    """
+    has_date = date_col in df.columns
+    date_ok = not has_date or pd.api.types.is_datetime64_any_dtype(df[date_col])
+    year_ok = "Year" in df.columns and pd.api.types.is_numeric_dtype(df["Year"])
 
-    if "Year" not in df.columns and date_col in df.columns:
-        df["Year"] = df[date_col].dt.year
+    new_cols: dict[str, pd.Series] = {}
 
-    if "Year" in df.columns:
-        df["Year"] = pd.to_numeric(df["Year"], errors="coerce")
+    if has_date and not date_ok:
+        # load_data already parsed the sheet's Date into Date_dt; reuse it
+        # instead of re-running the date parser on every rerun
+        if date_col == "Date" and "Date_dt" in df.columns:
+            new_cols[date_col] = df["Date_dt"]
+        else:
+            new_cols[date_col] = pd.to_datetime(df[date_col], errors="coerce")
 
-    return df
+    if "Year" not in df.columns and has_date:
+        new_cols["Year"] = new_cols.get(date_col, df[date_col]).dt.year
+    elif "Year" in df.columns and not year_ok:
+        new_cols["Year"] = pd.to_numeric(df["Year"], errors="coerce")
+
+    return df.assign(**new_cols) if new_cols else df
 
 
 def render_top_controls(*, team_view: str, df: pd.DataFrame) -> ControlsResult:
@@ -58,12 +159,14 @@ def render_top_controls(*, team_view: str, df: pd.DataFrame) -> ControlsResult:
     Returns the chosen values plus the prepared filtered-data bundle (fd).
     """
 
+    df_loaded = df  # the cached load_data() frame (stable identity between reruns)
     df = ensure_year_column(df)
 
         # Acquisitions: no top filters (keep wiring stable by returning defaults)
     if team_view == "Acquisitions":
         year_choice = "All years"
-        fd = prepare_filtered_data(df, year_choice)
+        # Sold/cut frames feed the map + calculator; buyer options are never shown here
+        fd = prepare_filtered_data(df, year_choice, with_buyer_options=False)
 
         return ControlsResult(
             mode="Both",
@@ -98,7 +201,7 @@ def render_top_controls(*, team_view: str, df: pd.DataFrame) -> ControlsResult:
     with col2:
         year_choice = st.selectbox("Year", ["All years"] + years_available + ["Last 12 months"], index=0)
 
-    fd = prepare_filtered_data(df, year_choice)
+    fd = prepare_filtered_data(df, year_choice, with_buyer_options=(team_view == "Dispo"))
 
     # Defaults
     buyer_choice = "All buyers"
@@ -119,12 +222,12 @@ def render_top_controls(*, team_view: str, df: pd.DataFrame) -> ControlsResult:
         # Buyer filter
         with col3:
             if mode in ["Sold", "Both"]:
-                labels, label_to_buyer = build_buyer_labels(fd.buyer_momentum, fd.buyers_plain)
+                labels, label_to_buyer = cached_buyer_labels(fd.buyer_momentum, tuple(fd.buyers_plain))
                 chosen_label = st.selectbox("Buyer", labels, index=0)
                 buyer_choice = label_to_buyer[chosen_label]
             else:
                 buyer_choice = "All buyers"
-                st.selectbox("Buyer", ["All buyers"], disabled=True)
+                st.selectbox("Buyer", _ALL_BUYERS, disabled=True)
 
         buyer_active = buyer_choice != "All buyers" and mode in ["Sold", "Both"]
 
@@ -132,27 +235,14 @@ def render_top_controls(*, team_view: str, df: pd.DataFrame) -> ControlsResult:
         with col4:
             rep_values: list[str] = []
             if mode in ["Sold", "Both"] and "Dispo_Rep_clean" in fd.df_time_sold.columns:
-                rep_values = sorted(
-                    [
-                        r
-                        for r in fd.df_time_sold["Dispo_Rep_clean"]
-                        .dropna()
-                        .astype(str)
-                        .str.strip()
-                        .unique()
-                        .tolist()
-                        if r
-                    ]
-                )
-
-            options = ["All dispo reps"] + rep_values
-            saved = st.session_state.get("dispo_rep_choice", "All dispo reps")
-            idx = options.index(saved) if saved in options else 0
+                rep_values = option_values(fd.df_time_sold["Dispo_Rep_clean"])
 
+            options = with_all_option(_ALL_DISPO_REPS, rep_values, "dispo reps", key="dispo_rep_choice")
+            # key= keeps the saved choice in session_state (init_state seeds it);
+            # Streamlit falls back to the first option if it is no longer offered.
             dispo_rep_choice = st.selectbox(
                 "Dispo rep",
                 options,
-                index=idx,
                 disabled=(mode == "Cut Loose"),
                 key="dispo_rep_choice",
             )
@@ -164,63 +254,30 @@ def render_top_controls(*, team_view: str, df: pd.DataFrame) -> ControlsResult:
             acq_values: list[str] = []
             # Use the time-filtered frame (sold+cut together) so options reflect the current year filter
             if "Acquisition_Rep_clean" in fd.df_time_filtered.columns:
-                acq_values = sorted(
-                    [
-                        r
-                        for r in fd.df_time_filtered["Acquisition_Rep_clean"]
-                        .dropna()
-                        .astype(str)
-                        .str.strip()
-                        .unique()
-                        .tolist()
-                        if r
-                    ]
-                )
-
-            acq_options = ["All acquisition reps"] + acq_values
-            saved_acq = st.session_state.get("dispo_acq_rep_choice", "All acquisition reps")
-            idx_acq = acq_options.index(saved_acq) if saved_acq in acq_options else 0
+                acq_values = option_values(fd.df_time_filtered["Acquisition_Rep_clean"])
 
+            acq_options = with_all_option(_ALL_ACQ_REPS, acq_values, "acquisition reps", key="dispo_acq_rep_choice")
             dispo_acq_rep_choice = st.selectbox(
                 "Acquisition rep",
                 acq_options,
-                index=idx_acq,
                 key="dispo_acq_rep_choice",
             )
 
             acq_rep_active = dispo_acq_rep_choice != "All acquisition reps"
 
     elif team_view == "Admin":
-        with col3:
-            markets: list[str] = []
-            if "Market_clean" in df.columns:
-                markets = sorted(
-                    [m for m in df["Market_clean"].dropna().astype(str).str.strip().unique().tolist() if m]
-                )
-            market_choice = st.selectbox("Market", ["All markets"] + markets, index=0)
-
-        with col4:
-            acq_reps: list[str] = []
-            if "Acquisition_Rep_clean" in df.columns:
-                acq_reps = sorted(
-                    [r for r in df["Acquisition_Rep_clean"].dropna().astype(str).str.strip().unique().tolist() if r]
-                )
-            acq_rep_choice = st.selectbox("Acquisition Rep", ["All acquisition reps"] + acq_reps, index=0)
-
-        with col5:
-            dispo_reps: list[str] = []
-            if "Dispo_Rep_clean" in df.columns:
-                dispo_reps = sorted(
-                    [r for r in df["Dispo_Rep_clean"].dropna().astype(str).str.strip().unique().tolist() if r]
-                )
-            dispo_rep_choice_admin = st.selectbox("Dispo rep", ["All dispo reps"] + dispo_reps, index=0)
+        choices = []
+        for col, spec in zip((col3, col4, col5), ADMIN_DROPDOWNS):
+            with col:
+                choices.append(render_dropdown(spec, df_loaded))
+        market_choice, acq_rep_choice, dispo_rep_choice_admin = choices
 
     else:
         # Acquisitions: show disabled buyer/rep to keep layout familiar
         with col3:
-            st.selectbox("Buyer", ["All buyers"], disabled=True)
+            st.selectbox("Buyer", _ALL_BUYERS, disabled=True)
         with col4:
-            st.selectbox("Dispo rep", ["All dispo reps"], disabled=True, key="dispo_rep_choice")
+            st.selectbox("Dispo rep", _ALL_DISPO_REPS, disabled=True, key="dispo_rep_choice")
 
     return ControlsResult(
         mode=mode,
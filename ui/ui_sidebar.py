@@ -1,7 +1,20 @@
 # ui_sidebar.py
+from functools import lru_cache
+
 import pandas as pd
 import streamlit as st
 
+from data.enrich import county_title
+
+
+@lru_cache(maxsize=8)
+def _county_lookups(options: tuple[str, ...]) -> tuple[tuple[str, ...], dict[str, str], dict[str, str]]:
+    """Title-case display names + UPPER<->Title lookups, built once per option list."""
+    titles = tuple(county_title(c) for c in options)
+    key_to_title = {c.upper(): t for c, t in zip(options, titles)}
+    title_to_key = {t: c.upper() for c, t in zip(options, titles)}
+    return titles, key_to_title, title_to_key
+
 
 def render_county_quick_search(
     *,
@@ -19,10 +32,8 @@ def render_county_quick_search(
     - Keeps dropdown synced to map clicks, but ONLY once per new click
       (so manual dropdown selection can override and stick)
     """
-    options = county_options or []
-    options_title = [placeholder] + [c.title() for c in options]
-    key_to_title = {c.upper(): c.title() for c in options}
-    title_to_key = {c.title(): c.upper() for c in options}
+    titles, key_to_title, title_to_key = _county_lookups(tuple(county_options or []))
+    options_title = [placeholder] + list(titles)
 
     # ✅ Sync dropdown to map click ONLY when a NEW map click happened
     if st.session_state.get("county_source") == "map":
@@ -154,7 +165,7 @@ def render_acquisitions_guidance(
         st.sidebar.markdown("---")
         return ""
 
-    chosen_title = chosen_key.title()
+    chosen_title = county_title(chosen_key)
 
     st.sidebar.markdown(
         f"""<div style="
@@ -15,6 +15,7 @@ import streamlit as st
 
 from calculators.calculator_logic import compute_feasibility
 from calculators.calculator_support import dollars
+from data.enrich import county_title
 
 
 def render_contract_calculator(
@@ -58,7 +59,7 @@ def render_contract_calculator(
     # UI (original style)
     # -----------------------------
     rec = result["rec"]
-    county_title = result["county_title"]
+    county_name = result["county_title"]
     conf = result["confidence"]
     input_price = result["input_price"]
 
@@ -95,7 +96,7 @@ def render_contract_calculator(
                     color: #E53935;
                     line-height: 1;
                 ">
-                    {county_title}
+                    {county_name}
                 </span>
             </div>
             """,
@@ -145,7 +146,7 @@ def render_contract_calculator(
                 st.caption(f"Model support: {support['n']} deals pulled from nearby counties.")
                 neigh_list = [c for c in support["counties"] if c != result["county_key"]]
                 if neigh_list:
-                    st.caption("Blended counties: " + ", ".join([n.title() for n in neigh_list]))
+                    st.caption("Blended counties: " + ", ".join([county_title(n) for n in neigh_list]))
             else:
                 st.caption(f"Model support: {support['n']} deals pulled from statewide history.")
 
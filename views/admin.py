@@ -10,6 +10,7 @@ import os
 import time
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -91,17 +92,17 @@ def render_sales_manager_dashboard(
 
     # ---- Headline metrics (prefer precomputed) ----
     if not headline:
-        gp = pd.to_numeric(df_sold_only.get("Gross_Profit"), errors="coerce").fillna(0)
-        total_gp = float(gp.sum())
+        gp = pd.to_numeric(df_sold_only.get("Gross_Profit"), errors="coerce")
+        total_gp = float(np.nansum(gp.to_numpy(dtype="float64")))
 
         if "Wholesale_Price_num" in df_sold_only.columns:
-            wholesale = pd.to_numeric(df_sold_only["Wholesale_Price_num"], errors="coerce").fillna(0)
+            wholesale = pd.to_numeric(df_sold_only["Wholesale_Price_num"], errors="coerce")
         elif "Wholesale_Price" in df_sold_only.columns:
-            wholesale = pd.to_numeric(df_sold_only["Wholesale_Price"], errors="coerce").fillna(0)
+            wholesale = pd.to_numeric(df_sold_only["Wholesale_Price"], errors="coerce")
         else:
             wholesale = pd.Series([0] * len(df_sold_only), dtype="float")
 
-        total_wholesale = float(wholesale.sum())
+        total_wholesale = float(np.nansum(wholesale.to_numpy(dtype="float64")))
         sold_count = int(len(df_sold_only))
         avg_gp = float(total_gp / sold_count) if sold_count else 0.0
 
@@ -177,7 +178,7 @@ def render_sales_manager_dashboard(
 
             gp_by_rep = (
                 df[df["Dispo_Rep_clean"].astype(str).str.strip() != ""]
-                .groupby("Dispo_Rep_clean")["Gross_Profit"]
+                .groupby("Dispo_Rep_clean", observed=True)["Gross_Profit"]
                 .sum()
                 .sort_values(ascending=False)
             )
@@ -215,7 +216,7 @@ def render_sales_manager_dashboard(
 
             gp_by_mkt = (
                 df[df["Market_clean"].astype(str).str.strip() != ""]
-                .groupby("Market_clean")["Gross_Profit"]
+                .groupby("Market_clean", observed=True)["Gross_Profit"]
                 .sum()
                 .sort_values(ascending=False)
             )
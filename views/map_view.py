@@ -43,7 +43,7 @@ def render_map_and_details(
     gp_total_by_county = gp_total_by_county or {}
     gp_avg_by_county = gp_avg_by_county or {}
 
-    county_counts_view = df_view.groupby("County_clean_up").size().to_dict() if not df_view.empty else {}
+    county_counts_view = df_view.groupby("County_clean_up", observed=True).size().to_dict() if not df_view.empty else {}
     county_properties_view = build_county_properties_view(df_view)
 
     tn_geo = load_tn_geojson()